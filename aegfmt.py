@@ -6,80 +6,121 @@ Formats Aegis source code with consistent style.
 
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
+_QUOTES = frozenset({'"', "'"})
+
 
 class AegisFormatter:
     def __init__(self):
         self.indent_size = 4
         self.max_line_length = 100
         self.quote_style = '"'  # prefer double quotes
+        # Indent strings up to 64 levels deep, built once instead of
+        # re-multiplying ' ' per line
+        self._indents = [' ' * (i * self.indent_size) for i in range(64)]
         
     def format_file(self, file_path: Path) -> str:
         """Format a single file and return formatted content."""
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return self.format_string(content)
-        
+            def split_lines():
+                ends_with_newline = False
+                for raw in f:
+                    ends_with_newline = raw.endswith('\n')
+                    yield raw[:-1] if ends_with_newline else raw
+                if ends_with_newline:
+                    yield ''
+            return self.format_lines(split_lines())
+
     def format_string(self, content: str) -> str:
         """Format a string of Aegis code."""
-        lines = content.split('\n')
-        formatted_lines = []
+        return self.format_lines(content.split('\n'))
+
+    def format_lines(self, lines) -> str:
+        """Format an iterable of Aegis source lines (without trailing newlines)."""
+        buf = []
+        append = buf.append
+        indents = self._indents
         indent_level = 0
         in_string = False
         string_char = None
-        
+
         for line in lines:
-            original_line = line
             line = line.strip()
-            
+
             if not line:
-                formatted_lines.append('')
+                append('\n')
                 continue
-                
+
             # Handle comments
             if line.startswith('~'):
-                formatted_lines.append(line)
+                append(line)
+                append('\n')
                 continue
                 
-            # Handle string literals
-            if not in_string:
-                # Check for string start
-                for i, char in enumerate(line):
-                    if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                        in_string = True
-                        string_char = char
-                        break
-            else:
-                # Check for string end
-                for i, char in enumerate(line):
-                    if char == string_char and (i == 0 or line[i-1] != '\\'):
+            # Track string literals in a single pass so multiple quotes
+            # on one line toggle state correctly
+            line_started_in_string = in_string
+            i = 0
+            n = len(line)
+            while i < n:
+                char = line[i]
+                if in_string:
+                    if char == '\\':
+                        i += 2
+                        continue
+                    if char == string_char:
                         in_string = False
                         string_char = None
-                        break
-                        
-            if in_string:
-                formatted_lines.append(' ' * (indent_level * self.indent_size) + line)
+                elif char in _QUOTES:
+                    in_string = True
+                    string_char = char
+                i += 1
+
+            if indent_level >= len(indents):
+                indents.extend(
+                    ' ' * (i * self.indent_size)
+                    for i in range(len(indents), indent_level + 1)
+                )
+
+            if line_started_in_string:
+                append(indents[indent_level])
+                append(line)
+                append('\n')
                 continue
-                
+
             # Handle indentation changes
             if line.endswith('{'):
-                formatted_lines.append(' ' * (indent_level * self.indent_size) + line)
+                append(indents[indent_level])
+                append(line)
+                append('\n')
                 indent_level += 1
             elif line.startswith('}'):
                 indent_level = max(0, indent_level - 1)
-                formatted_lines.append(' ' * (indent_level * self.indent_size) + line)
+                append(indents[indent_level])
+                append(line)
+                append('\n')
             else:
-                formatted_lines.append(' ' * (indent_level * self.indent_size) + line)
-                
-        return '\n'.join(formatted_lines)
+                append(indents[indent_level])
+                append(line)
+                append('\n')
+
+        if buf:
+            buf.pop()  # no trailing newline; lines are joined, not terminated
+        return ''.join(buf)
         
     def format_directory(self, directory: Path, recursive: bool = True) -> None:
-        """Format all .aeg files in a directory."""
+        """Format all .aeg files in a directory, in parallel across CPUs."""
         pattern = "**/*.aeg" if recursive else "*.aeg"
-        for file_path in directory.glob(pattern):
-            self.format_single_file(file_path)
+        paths = list(directory.glob(pattern))
+        if len(paths) <= 1:
+            for file_path in paths:
+                self.format_single_file(file_path)
+            return
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(_format_one, paths, chunksize=16))
             
     def format_single_file(self, file_path: Path) -> None:
         """Format a single file in place."""
@@ -92,6 +133,11 @@ class AegisFormatter:
             print(f"Error formatting {file_path}: {e}")
 
 
+def _format_one(file_path: Path) -> None:
+    """Worker for format_directory; must be top-level so it pickles."""
+    AegisFormatter().format_single_file(file_path)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: aegfmt <file_or_directory> [options]")
@@ -1,149 +1,206 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import List, Optional, Any
 
+# Nodes are allocated in bulk while parsing; slots=True drops the
+# per-instance __dict__/__weakref__ (the dataclasses arg exists on 3.10+)
+if sys.version_info >= (3, 10):
+    _dc = dataclass(slots=True)
+else:
+    _dc = dataclass
 
-@dataclass
+
+def _node_dataclass(cls):
+    # Every concrete node carries an _eval slot: the interpreter caches
+    # its resolved dispatch handler there after the first visit.
+    if cls.__name__ != "Node":
+        if "__annotations__" not in cls.__dict__:
+            cls.__annotations__ = {}
+        cls.__annotations__["_eval"] = "Any"
+        setattr(cls, "_eval", field(default=None, repr=False, compare=False))
+    return _dc(cls)
+
+
+@_node_dataclass
 class Node:
     line: int
     col: int
 
 
-@dataclass
+@_node_dataclass
 class Program(Node):
     body: List[Node]
+    _handlers: Any = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@_node_dataclass
 class Block(Node):
     statements: List[Node]
+    _handlers: Any = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@_node_dataclass
 class LetStatement(Node):
     name: str
     value: Node
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
 
-@dataclass
+
+@_node_dataclass
 class AssignStatement(Node):
     target: Node  # Identifier or Index or Member
     value: Node
 
 
-@dataclass
+@_node_dataclass
 class IfStatement(Node):
     test: Node
     consequent: Block
     alternate: Optional[Block]
 
 
-@dataclass
+@_node_dataclass
 class WhileStatement(Node):
     test: Node
     body: Block
 
 
-@dataclass
+@_node_dataclass
 class ReturnStatement(Node):
     value: Optional[Node]
 
 
-@dataclass
+@_node_dataclass
 class FunctionDefinition(Node):
     name: Optional[str]
     params: List[str]
     body: Block
 
+    def __post_init__(self):
+        if self.name is not None:
+            self.name = sys.intern(self.name)
+
 
-@dataclass
+@_node_dataclass
 class ExpressionStatement(Node):
     expression: Node
 
 
-@dataclass
+@_node_dataclass
 class Identifier(Node):
     value: str
+    _slot: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.value = sys.intern(self.value)
+
+
+@_node_dataclass
+class LiteralNode(Node):
+    """Canonical constant node: numbers, strings, booleans, and null.
+
+    The parser emits this for all literals so the interpreter serves
+    them from one trivial handler; the specific literal classes below
+    are kept for compatibility.
+    """
+    value: Any
 
 
-@dataclass
+@_node_dataclass
 class NumberLiteral(Node):
     value: Any
 
 
-@dataclass
+@_node_dataclass
 class StringLiteral(Node):
     value: str
 
 
-@dataclass
+@_node_dataclass
 class BooleanLiteral(Node):
     value: bool
 
 
-@dataclass
+@_node_dataclass
 class NullLiteral(Node):
     pass
 
 
-@dataclass
+@_node_dataclass
 class ArrayLiteral(Node):
     elements: List[Node]
+    _elements_tuple: Any = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@_node_dataclass
 class ObjectProperty(Node):
     key: str
     value: Node
 
+    def __post_init__(self):
+        self.key = sys.intern(self.key)
 
-@dataclass
+
+@_node_dataclass
 class ObjectLiteral(Node):
     properties: List[ObjectProperty]
+    _keys: Any = field(default=None, repr=False, compare=False)
+    _value_exprs: Any = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@_node_dataclass
 class PrefixExpression(Node):
     operator: str
     right: Node
 
 
-@dataclass
+@_node_dataclass
 class InfixExpression(Node):
     left: Node
     operator: str
     right: Node
+    _op_fn: Any = field(default=None, repr=False, compare=False)
+    _fast_op: Any = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@_node_dataclass
 class CallExpression(Node):
     callee: Node
     args: List[Node]
 
 
-@dataclass
+@_node_dataclass
 class IndexExpression(Node):
     collection: Node
     index: Node
 
 
-@dataclass
+@_node_dataclass
 class MemberExpression(Node):
     object: Node
     property: str
 
+    def __post_init__(self):
+        self.property = sys.intern(self.property)
+
 
 # New AST nodes for classes and error handling
 
-@dataclass
+@_node_dataclass
 class ClassDefinition(Node):
     name: str
     superclass: Optional[Identifier]
     methods: List[MethodDefinition]
     static_methods: List[MethodDefinition]
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
+
 
-@dataclass
+@_node_dataclass
 class MethodDefinition(Node):
     name: str
     params: List[str]
@@ -151,69 +208,90 @@ class MethodDefinition(Node):
     is_static: bool = False
     is_override: bool = False
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
 
-@dataclass
+
+@_node_dataclass
 class NewExpression(Node):
     class_name: Identifier
     args: List[Node]
 
 
-@dataclass
+@_node_dataclass
 class SuperExpression(Node):
     method: str
 
+    def __post_init__(self):
+        self.method = sys.intern(self.method)
+
 
-@dataclass
+@_node_dataclass
 class TryStatement(Node):
     try_block: Block
     catch_blocks: List[CatchBlock]
     finally_block: Optional[Block]
 
 
-@dataclass
+@_node_dataclass
 class CatchBlock(Node):
     exception_type: Optional[str]
     exception_var: Optional[str]
     body: Block
 
+    def __post_init__(self):
+        if self.exception_type is not None:
+            self.exception_type = sys.intern(self.exception_type)
+        if self.exception_var is not None:
+            self.exception_var = sys.intern(self.exception_var)
 
-@dataclass
+
+@_node_dataclass
 class ThrowStatement(Node):
     expression: Node
 
 
-@dataclass
+@_node_dataclass
 class AssertStatement(Node):
     condition: Node
     message: Optional[Node]
 
 
-@dataclass
+@_node_dataclass
 class AwaitExpression(Node):
     expression: Node
 
 
-@dataclass
+@_node_dataclass
 class AsyncFunctionDefinition(Node):
     name: Optional[str]
     params: List[str]
     body: Block
 
 
-@dataclass
+@_node_dataclass
 class ImportStatement(Node):
     module: str
     imports: List[str]  # specific imports, empty means import all
     alias: Optional[str]  # for "import x as y"
 
+    def __post_init__(self):
+        self.module = sys.intern(self.module)
+        self.imports = [sys.intern(n) for n in self.imports]
+        if self.alias is not None:
+            self.alias = sys.intern(self.alias)
+
 
-@dataclass
+@_node_dataclass
 class ExportStatement(Node):
     name: str
     value: Optional[Node]  # None means re-export
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
 
-@dataclass
+
+@_node_dataclass
 class ForStatement(Node):
     init: Optional[Node]
     condition: Optional[Node]
@@ -221,42 +299,45 @@ class ForStatement(Node):
     body: Block
 
 
-@dataclass
+@_node_dataclass
 class ForInStatement(Node):
     variable: str
     iterable: Node
     body: Block
 
+    def __post_init__(self):
+        self.variable = sys.intern(self.variable)
+
 
-@dataclass
+@_node_dataclass
 class SwitchStatement(Node):
     expression: Node
     cases: List[SwitchCase]
     default_case: Optional[Block]
 
 
-@dataclass
+@_node_dataclass
 class SwitchCase(Node):
     value: Optional[Node]  # None for default case
     body: Block
 
 
-@dataclass
+@_node_dataclass
 class BreakStatement(Node):
     pass
 
 
-@dataclass
+@_node_dataclass
 class ContinueStatement(Node):
     pass
 
 
-@dataclass
+@_node_dataclass
 class WithStatement(Node):
     resource: Node
     body: Block
 
 
-@dataclass
+@_node_dataclass
 class DeferStatement(Node):
     expression: Node
\ No newline at end of file
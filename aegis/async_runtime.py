@@ -5,141 +5,165 @@ Provides async/await primitives and event loop management.
 
 from __future__ import annotations
 import asyncio
-import time
+import threading
 from typing import Any, Callable, List, Dict, Optional
-from dataclasses import dataclass
 from .runtime import Environment, NativeFunction, RuntimeErrorAegis
 
 
-@dataclass
 class Promise:
-    """Represents an async operation that may complete in the future."""
-    value: Any = None
-    error: Optional[Exception] = None
-    resolved: bool = False
-    callbacks: List[Callable] = None
-    
-    def __post_init__(self):
-        if self.callbacks is None:
-            self.callbacks = []
-    
+    """Represents an async operation that may complete in the future.
+
+    Thin wrapper over an asyncio.Future so callback scheduling and
+    fan-in happen in the C-level future machinery instead of a
+    hand-rolled callback list.
+    """
+
+    __slots__ = ("future", "loop")
+
+    def __init__(self, future: asyncio.Future, loop: asyncio.AbstractEventLoop):
+        self.future = future
+        self.loop = loop
+
+    @property
+    def resolved(self) -> bool:
+        return self.future.done()
+
+    @property
+    def value(self) -> Any:
+        if self.future.done() and self.future.exception() is None:
+            return self.future.result()
+        return None
+
+    @property
+    def error(self) -> Optional[Exception]:
+        if self.future.done():
+            return self.future.exception()
+        return None
+
     def then(self, callback: Callable) -> 'Promise':
-        """Chain a callback to be called when the promise resolves."""
-        if self.resolved:
-            if self.error:
-                raise self.error
-            callback(self.value)
-        else:
-            self.callbacks.append(callback)
+        """Chain a callback to be called when the promise settles.
+
+        The callback receives the resolved value, or the error on
+        rejection (matching the previous Promise semantics).
+        """
+        def _invoke(fut: asyncio.Future) -> None:
+            err = fut.exception()
+            callback(err if err is not None else fut.result())
+
+        self.loop.call_soon_threadsafe(self.future.add_done_callback, _invoke)
         return self
-    
+
     def resolve(self, value: Any) -> None:
         """Resolve the promise with a value."""
-        self.value = value
-        self.resolved = True
-        for callback in self.callbacks:
-            callback(value)
-    
+        def _set() -> None:
+            if not self.future.done():
+                self.future.set_result(value)
+        self.loop.call_soon_threadsafe(_set)
+
     def reject(self, error: Exception) -> None:
         """Reject the promise with an error."""
-        self.error = error
-        self.resolved = True
-        for callback in self.callbacks:
-            callback(error)
+        def _set() -> None:
+            if not self.future.done():
+                self.future.set_exception(error)
+        self.loop.call_soon_threadsafe(_set)
 
 
 class AsyncRuntime:
     """Manages async operations and event loop."""
-    
+
     def __init__(self):
-        self.loop = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.tasks: List[asyncio.Task] = []
         self.timers: Dict[str, Any] = {}
-        
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
     def start_loop(self) -> None:
-        """Start the event loop if not already running."""
-        if self.loop is None or self.loop.is_closed():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-    
+        """Start the event loop on a background thread if not already running."""
+        with self._loop_lock:
+            if self.loop is None or self.loop.is_closed():
+                self.loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self.loop.run_forever, daemon=True
+                )
+                self._loop_thread.start()
+
     def stop_loop(self) -> None:
         """Stop the event loop and clean up."""
         if self.loop and not self.loop.is_closed():
-            # Cancel all tasks
             for task in self.tasks:
                 task.cancel()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            if self._loop_thread is not None:
+                self._loop_thread.join(timeout=1.0)
+                self._loop_thread = None
             self.loop.close()
-    
+
     def create_promise(self) -> Promise:
         """Create a new promise."""
-        return Promise()
-    
+        self.start_loop()
+        return Promise(asyncio.Future(loop=self.loop), self.loop)
+
     def sleep(self, seconds: float) -> Promise:
         """Create a promise that resolves after the given delay."""
         promise = self.create_promise()
-        
-        def resolve_after():
-            time.sleep(seconds)
-            promise.resolve(None)
-        
-        # Run in background thread to avoid blocking
-        import threading
-        thread = threading.Thread(target=resolve_after)
-        thread.daemon = True
-        thread.start()
-        
+
+        def _resolve() -> None:
+            if not promise.future.done():
+                promise.future.set_result(None)
+
+        # A plain loop timer: no coroutine or Task allocation per sleep
+        self.loop.call_soon_threadsafe(
+            lambda: self.loop.call_later(seconds, _resolve)
+        )
         return promise
-    
+
     def timeout(self, promise: Promise, seconds: float) -> Promise:
         """Create a promise that rejects if the given promise doesn't resolve in time."""
         timeout_promise = self.create_promise()
-        
-        def timeout_handler():
-            time.sleep(seconds)
-            if not promise.resolved:
-                timeout_promise.reject(TimeoutError(f"Operation timed out after {seconds} seconds"))
-        
-        import threading
-        thread = threading.Thread(target=timeout_handler)
-        thread.daemon = True
-        thread.start()
-        
+
+        def _on_timeout() -> None:
+            if not promise.future.done() and not timeout_promise.future.done():
+                timeout_promise.future.set_exception(
+                    TimeoutError(f"Operation timed out after {seconds} seconds")
+                )
+
+        self.loop.call_soon_threadsafe(
+            lambda: self.loop.call_later(seconds, _on_timeout)
+        )
         return timeout_promise
-    
+
     def all(self, promises: List[Promise]) -> Promise:
         """Create a promise that resolves when all given promises resolve."""
         all_promise = self.create_promise()
-        results = []
-        completed = 0
-        
-        def check_completion():
-            nonlocal completed
-            completed += 1
-            if completed == len(promises):
-                all_promise.resolve(results)
-        
+        if not promises:
+            all_promise.resolve([])
+            return all_promise
+
+        results = [None] * len(promises)
+        remaining = [len(promises)]
+
         for i, promise in enumerate(promises):
-            def make_handler(index):
-                def handler(value):
-                    results[index] = value
-                    check_completion()
-                return handler
-            
-            promise.then(make_handler(i))
-        
+            def handler(value, _index=i):
+                results[_index] = value
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    all_promise.resolve(results)
+
+            promise.then(handler)
+
         return all_promise
-    
+
     def race(self, promises: List[Promise]) -> Promise:
         """Create a promise that resolves with the first promise to resolve."""
         race_promise = self.create_promise()
-        
+
         def resolve_first(value):
-            if not race_promise.resolved:
-                race_promise.resolve(value)
-        
+            race_promise.resolve(value)
+
         for promise in promises:
             promise.then(resolve_first)
-        
+
         return race_promise
 
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from typing import Any, List, Dict, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
 import base64
 import binascii
+import functools
 import hashlib
 import hmac
 import os
@@ -11,42 +13,73 @@ from urllib.parse import urlencode, quote_plus, unquote_plus, urlparse, urljoin
 from urllib import robotparser
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+# orjson parses directly from bytes in C when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from .runtime import NativeFunction
 from .security import SECURITY_FUNCTIONS
 
 
+class _ArgSplat:
+    """Slotted callable that unpacks the interpreter's args list."""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[..., Any]):
+        self.fn = fn
+
+    def __call__(self, args: List[Any]):
+        return self.fn(*args)
+
+
 def _wrap(fn: Callable[..., Any]):
-    def inner(args: List[Any]):
-        return fn(*args)
-    nf = NativeFunction(name=fn.__name__, func=inner)
-    return nf
+    return NativeFunction(name=fn.__name__, func=_ArgSplat(fn))
 
 
 # -------------------- HTTP --------------------
 
+@functools.lru_cache(maxsize=1)
 def make_http() -> Dict[str, Any]:
+    # One shared session for the module-level helpers: keep-alive and a
+    # sized connection pool instead of a fresh Session (and TCP/TLS
+    # handshake) per call.
+    _default_session = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+    _default_session.mount("https://", _adapter)
+    _default_session.mount("http://", _adapter)
+
     def to_resp(r: requests.Response) -> Dict[str, Any]:
-        text = r.text
-        headers = {k: v for k, v in r.headers.items()}
-        try:
-            js = r.json()
-        except Exception:
-            js = None
+        headers = dict(r.headers)
+        # Parse JSON straight from the raw bytes (skipping the second
+        # charset decode r.json() would do), and only for responses
+        # that declare a JSON content type. Look the header up on
+        # r.headers (case-insensitive) rather than the plain dict:
+        # HTTP/2 servers send it lowercased
+        js = None
+        if "json" in r.headers.get("Content-Type", ""):
+            try:
+                js = _json_loads(r.content)
+            except Exception:
+                js = None
         return {
             "status": r.status_code,
             "headers": headers,
-            "text": text,
+            "text": r.text,
             "json": js,
         }
 
     def get(url: str, headers: Dict[str, str] = None):
-        r = requests.get(url, headers=headers)
+        r = _default_session.get(url, headers=headers)
         return to_resp(r)
 
     def post(url: str, data: Any = None, json_body: Any = None, headers: Dict[str, str] = None):
-        r = requests.post(url, data=data, json=json_body, headers=headers)
+        r = _default_session.post(url, data=data, json=json_body, headers=headers)
         return to_resp(r)
 
     def fetch(opts: Dict[str, Any]):
@@ -56,7 +89,7 @@ def make_http() -> Dict[str, Any]:
         params = opts.get("params")
         data = opts.get("data")
         json_body = opts.get("json")
-        r = requests.request(method, url, headers=headers, params=params, data=data, json=json_body)
+        r = _default_session.request(method, url, headers=headers, params=params, data=data, json=json_body)
         return to_resp(r)
 
     def session():
@@ -85,27 +118,31 @@ def make_http() -> Dict[str, Any]:
         }
 
     def batch(reqs: List[Dict[str, Any]]):
-        results = []
-        for req in reqs:
-            results.append(fetch(req))
-        return results
-
-    # robots.txt helper with cache
-    robots_cache: Dict[str, robotparser.RobotFileParser] = {}
+        if not reqs:
+            return []
+        if len(reqs) == 1:
+            return [fetch(reqs[0])]
+        # Each fetch is independent network I/O; requests releases the
+        # GIL in the socket layer, so threads overlap the round-trips
+        with ThreadPoolExecutor(max_workers=min(32, len(reqs))) as executor:
+            return list(executor.map(fetch, reqs))
+
+    # robots.txt helper with a bounded cache so long-running scripts
+    # that touch many hosts don't grow the parser table without limit
+    @functools.lru_cache(maxsize=256)
+    def _get_robots_parser(base: str) -> robotparser.RobotFileParser:
+        rb = robotparser.RobotFileParser()
+        rb.set_url(urljoin(base, "/robots.txt"))
+        try:
+            rb.read()
+        except Exception:
+            pass
+        return rb
 
     def robots_can_fetch(user_agent: str, url: str):
         parsed = urlparse(url)
         base = f"{parsed.scheme}://{parsed.netloc}"
-        rb = robots_cache.get(base)
-        if rb is None:
-            rb = robotparser.RobotFileParser()
-            rb.set_url(urljoin(base, "/robots.txt"))
-            try:
-                rb.read()
-            except Exception:
-                pass
-            robots_cache[base] = rb
-        return bool(rb.can_fetch(user_agent, url))
+        return bool(_get_robots_parser(base).can_fetch(user_agent, url))
 
     return {
         "get": _wrap(get),
@@ -119,34 +156,46 @@ def make_http() -> Dict[str, Any]:
 
 # -------------------- HTML --------------------
 
+# Prefer the C-based lxml backend when it is installed; BeautifulSoup's
+# backend registry lookup is also skipped by passing the name explicitly.
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+
 class _NodeWrapper:
+    __slots__ = ("_el",)
+
     def __init__(self, el):
         self._el = el
 
-    def as_object(self) -> Dict[str, Any]:
-        def css(selector: str):
-            return [ _NodeWrapper(e).as_object() for e in self._el.select(selector) ]
+    def css(self, selector: str):
+        return [ _NodeWrapper(e).as_object() for e in self._el.select(selector) ]
 
-        def text():
-            return self._el.get_text()
+    def text(self):
+        return self._el.get_text()
 
-        def attr(name: str):
-            return self._el.get(name)
+    def attr(self, name: str):
+        return self._el.get(name)
 
-        def html():
-            return str(self._el)
+    def html(self):
+        return str(self._el)
 
+    def as_object(self) -> Dict[str, Any]:
         return {
-            "css": _wrap(css),
-            "text": _wrap(text),
-            "attr": _wrap(attr),
-            "html": _wrap(html),
+            "css": _wrap(self.css),
+            "text": _wrap(self.text),
+            "attr": _wrap(self.attr),
+            "html": _wrap(self.html),
         }
 
 
+@functools.lru_cache(maxsize=1)
 def make_html() -> Dict[str, Any]:
     def parse_html(html_str: str):
-        soup = BeautifulSoup(html_str, "html.parser")
+        soup = BeautifulSoup(html_str, _HTML_PARSER)
         return _NodeWrapper(soup).as_object()
 
     return {
@@ -156,6 +205,7 @@ def make_html() -> Dict[str, Any]:
 
 # -------------------- CRYPTO --------------------
 
+@functools.lru_cache(maxsize=1)
 def make_crypto() -> Dict[str, Any]:
     def sha256(data: Any):
         return hashlib.sha256(_to_bytes(data)).hexdigest()
@@ -167,7 +217,9 @@ def make_crypto() -> Dict[str, Any]:
         return hashlib.md5(_to_bytes(data)).hexdigest()
 
     def hmac_sha256(key: Any, data: Any):
-        return hmac.new(_to_bytes(key), _to_bytes(data), hashlib.sha256).hexdigest()
+        # hmac.digest is the C-accelerated one-shot path; it skips the
+        # Python-level HMAC object construction of hmac.new
+        return hmac.digest(_to_bytes(key), _to_bytes(data), "sha256").hex()
 
     def random_bytes(n: int):
         return binascii.hexlify(os.urandom(int(n))).decode()
@@ -183,18 +235,20 @@ def make_crypto() -> Dict[str, Any]:
 
 # -------------------- ENCODING --------------------
 
+@functools.lru_cache(maxsize=1)
 def make_encoding() -> Dict[str, Any]:
     def base64_encode(data: Any):
         return base64.b64encode(_to_bytes(data)).decode()
 
     def base64_decode(data: str):
-        return base64.b64decode(data.encode()).decode(errors="ignore")
+        # b64decode accepts str directly; no need to encode first
+        return base64.b64decode(data).decode("utf-8", errors="ignore")
 
     def hex_encode(data: Any):
-        return binascii.hexlify(_to_bytes(data)).decode()
+        return _to_bytes(data).hex()
 
     def hex_decode(data: str):
-        return binascii.unhexlify(data.encode()).decode(errors="ignore")
+        return bytes.fromhex(data).decode("utf-8", errors="ignore")
 
     def url_encode(params: Dict[str, Any]):
         return urlencode(params)
@@ -218,6 +272,7 @@ def make_encoding() -> Dict[str, Any]:
 
 # -------------------- URL --------------------
 
+@functools.lru_cache(maxsize=1)
 def make_url() -> Dict[str, Any]:
     def parse_url(u: str):
         p = urlparse(u)
@@ -240,38 +295,47 @@ def make_url() -> Dict[str, Any]:
 
 # -------------------- REGEX --------------------
 
+@functools.lru_cache(maxsize=1)
 def make_regex() -> Dict[str, Any]:
     import re
 
-    def _flags(opts: Optional[Dict[str, bool]] = None) -> int:
-        if not opts:
-            return 0
+    @functools.lru_cache(maxsize=32)
+    def _flags_cached(opts_keys: frozenset) -> int:
         m = 0
-        if opts.get("i") or opts.get("ignorecase"):
+        if "i" in opts_keys or "ignorecase" in opts_keys:
             m |= re.IGNORECASE
-        if opts.get("m") or opts.get("multiline"):
+        if "m" in opts_keys or "multiline" in opts_keys:
             m |= re.MULTILINE
-        if opts.get("s") or opts.get("dotall"):
+        if "s" in opts_keys or "dotall" in opts_keys:
             m |= re.DOTALL
         return m
 
+    def _flags(opts: Optional[Dict[str, bool]] = None) -> int:
+        if not opts:
+            return 0
+        return _flags_cached(frozenset(k for k, v in opts.items() if v))
+
+    @functools.lru_cache(maxsize=1024)
+    def _compiled(pattern: str, flags: int) -> "re.Pattern[str]":
+        return re.compile(pattern, flags)
+
     def findall(pattern: str, text: str, flags: Optional[Dict[str, bool]] = None):
-        return re.findall(pattern, text, _flags(flags))
+        return _compiled(pattern, _flags(flags)).findall(text)
 
     def search(pattern: str, text: str, flags: Optional[Dict[str, bool]] = None):
-        m = re.search(pattern, text, _flags(flags))
+        m = _compiled(pattern, _flags(flags)).search(text)
         if not m:
             return None
         return {"match": m.group(0), "groups": list(m.groups())}
 
     def match(pattern: str, text: str, flags: Optional[Dict[str, bool]] = None):
-        m = re.match(pattern, text, _flags(flags))
+        m = _compiled(pattern, _flags(flags)).match(text)
         if not m:
             return None
         return {"match": m.group(0), "groups": list(m.groups())}
 
     def sub(pattern: str, repl: str, text: str, flags: Optional[Dict[str, bool]] = None):
-        return re.sub(pattern, repl, text, _flags(flags))
+        return _compiled(pattern, _flags(flags)).sub(repl, text)
 
     return {
         "findall": _wrap(findall),
@@ -307,6 +371,7 @@ def make_fs(flags: Dict[str, bool]) -> Dict[str, Any]:
 
 # -------------------- TIME --------------------
 
+@functools.lru_cache(maxsize=1)
 def make_time() -> Dict[str, Any]:
     def now_ms():
         return int(time.time() * 1000)
@@ -326,7 +391,7 @@ def make_time() -> Dict[str, Any]:
 
 
 def _to_bytes(data: Any) -> bytes:
-    if isinstance(data, bytes):
+    if isinstance(data, (bytes, bytearray, memoryview)):
         return data
     if isinstance(data, str):
         return data.encode()
@@ -4,38 +4,135 @@ Provides class instantiation, method dispatch, and inheritance.
 """
 
 from __future__ import annotations
+import sys
+from itertools import zip_longest
 from typing import Any, Dict, List, Optional, Callable
 from dataclasses import dataclass
 from .runtime import Environment, RuntimeErrorAegis, FunctionValue
 
+# Same slots gate as ast_nodes/runtime (the dataclasses arg exists on 3.10+)
+if sys.version_info >= (3, 10):
+    _dc = dataclass(slots=True)
+else:
+    _dc = dataclass
+from . import ast_nodes as AST
 
-@dataclass
+# Marks a declared-but-unassigned field slot
+_UNSET = object()
+
+# Bound once on first use; importing per method call costs a
+# sys.modules lookup plus an attribute fetch each time. The import
+# stays lazy because interpreter imports this module at load time.
+_call_function_body = None
+
+
+def _bind_params(env: Environment, params, args: List[Any]) -> None:
+    if len(args) < len(params):
+        env.store.update(zip_longest(params, args))
+    else:
+        env.store.update(zip(params, args))
+
+
+def _body_runner():
+    global _call_function_body
+    if _call_function_body is None:
+        from .interpreter import call_function_body
+        _call_function_body = call_function_body
+    return _call_function_body
+
+
+def _scan_field_names(methods: Dict[str, FunctionValue]) -> List[str]:
+    """Collect field names assigned as 'this.<name> = ...' in __init__.
+
+    The constructor fixes the field layout for most classes, so those
+    names can be stored in a dense list indexed by slot number instead
+    of a per-instance dict.
+    """
+    constructor = methods.get("__init__")
+    if constructor is None:
+        return []
+    names: List[str] = []
+    seen = set()
+    stack: List[Any] = [constructor.body]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, AST.Block):
+            stack.extend(node.statements)
+        elif isinstance(node, AST.AssignStatement):
+            target = node.target
+            if (isinstance(target, AST.MemberExpression)
+                    and isinstance(target.object, AST.Identifier)
+                    and target.object.value == "this"
+                    and target.property not in seen):
+                seen.add(target.property)
+                names.append(target.property)
+        elif isinstance(node, (AST.IfStatement, AST.WhileStatement)):
+            for block in (getattr(node, "consequent", None),
+                          getattr(node, "alternate", None),
+                          getattr(node, "body", None)):
+                if block is not None:
+                    stack.append(block)
+    return names
+
+
+@_dc
 class ClassInstance:
     """Represents an instance of a class."""
     class_name: str
     fields: Dict[str, Any]
     methods: Dict[str, FunctionValue]
     superclass: Optional['ClassInstance'] = None
-    
+    _method_cache: Dict[str, Optional[FunctionValue]] = None
+    # Dense storage for fields whose layout __init__ fixes: slot_map
+    # is shared per class, field_slots is one list per instance. The
+    # fields dict stays as the fallback for dynamic names.
+    slot_map: Dict[str, int] = None
+    field_slots: List[Any] = None
+
+    def __post_init__(self):
+        if self._method_cache is None:
+            self._method_cache = {}
+        if self.slot_map is None:
+            self.slot_map = {}
+        if self.field_slots is None:
+            self.field_slots = [_UNSET] * len(self.slot_map)
+
     def get_field(self, name: str) -> Any:
         """Get a field value."""
-        if name in self.fields:
+        slot = self.slot_map.get(name)
+        if slot is not None:
+            value = self.field_slots[slot]
+            if value is not _UNSET:
+                return value
+        elif name in self.fields:
             return self.fields[name]
         if self.superclass:
             return self.superclass.get_field(name)
         raise RuntimeErrorAegis(f"Field '{name}' not found in {self.class_name}")
-    
+
     def set_field(self, name: str, value: Any) -> None:
         """Set a field value."""
-        self.fields[name] = value
+        slot = self.slot_map.get(name)
+        if slot is not None:
+            self.field_slots[slot] = value
+        else:
+            self.fields[name] = value
     
     def get_method(self, name: str) -> Optional[FunctionValue]:
-        """Get a method by name."""
-        if name in self.methods:
-            return self.methods[name]
-        if self.superclass:
-            return self.superclass.get_method(name)
-        return None
+        """Get a method by name.
+
+        Resolutions (including misses) are cached per instance so the
+        superclass chain is walked at most once per method name.
+        """
+        try:
+            return self._method_cache[name]
+        except KeyError:
+            pass
+        method = self.methods.get(name)
+        if method is None and self.superclass:
+            method = self.superclass.get_method(name)
+        self._method_cache[name] = method
+        return method
     
     def call_method(self, name: str, args: List[Any], env: Environment) -> Any:
         """Call a method on this instance."""
@@ -47,32 +144,45 @@ class ClassInstance:
         method_env = Environment(outer=method.env)
         method_env.define("this", self)
         
-        # Bind arguments
-        for i, param in enumerate(method.params):
-            if i < len(args):
-                method_env.define(param, args[i])
-            else:
-                method_env.define(param, None)
+        # Bind arguments; zip pads short calls with None in C
+        _bind_params(method_env, method.params, args)
         
         # Execute method body
-        from .interpreter import evaluate
-        return evaluate(method.body, method_env)
+        return _body_runner()(method.body, method_env)
 
 
-@dataclass
+@_dc
 class ClassDefinition:
     """Represents a class definition."""
     name: str
     superclass: Optional[str]
     methods: Dict[str, FunctionValue]
     static_methods: Dict[str, FunctionValue]
-    
+    # Own methods merged over the full ancestor chain, built once at
+    # definition time so instance lookup never walks the chain
+    flat_methods: Dict[str, FunctionValue] = None
+    # name -> slot index for fields assigned in __init__, shared by
+    # every instance of the class
+    field_slot_map: Dict[str, int] = None
+
+    def __post_init__(self):
+        if self.flat_methods is None:
+            self.flat_methods = dict(self.methods)
+        if self.field_slot_map is None:
+            self.field_slot_map = {
+                name: i for i, name in enumerate(_scan_field_names(self.flat_methods))
+            }
+
     def instantiate(self, args: List[Any], env: Environment) -> ClassInstance:
         """Create a new instance of this class."""
+        # flat_methods is treated as immutable once the class is
+        # defined, so every instance can share the same dict instead of
+        # copying it per instantiation
         instance = ClassInstance(
             class_name=self.name,
             fields={},
-            methods=self.methods.copy()
+            methods=self.flat_methods,
+            slot_map=self.field_slot_map,
         )
         
         # Call constructor if it exists
@@ -82,16 +192,11 @@ class ClassDefinition:
             constructor_env = Environment(outer=constructor.env)
             constructor_env.define("this", instance)
             
-            # Bind arguments
-            for i, param in enumerate(constructor.params):
-                if i < len(args):
-                    constructor_env.define(param, args[i])
-                else:
-                    constructor_env.define(param, None)
+            # Bind arguments; zip pads short calls with None in C
+            _bind_params(constructor_env, constructor.params, args)
             
             # Execute constructor
-            from .interpreter import evaluate
-            evaluate(constructor.body, constructor_env)
+            _body_runner()(constructor.body, constructor_env)
         
         return instance
 
@@ -108,12 +213,18 @@ class ClassRuntime:
         """Define a new class."""
         if superclass and superclass not in self.classes:
             raise RuntimeErrorAegis(f"Superclass '{superclass}' not found")
-        
+
+        flat_methods: Dict[str, FunctionValue] = {}
+        if superclass:
+            flat_methods.update(self.classes[superclass].flat_methods)
+        flat_methods.update(methods)
+
         self.classes[name] = ClassDefinition(
             name=name,
             superclass=superclass,
             methods=methods,
-            static_methods=static_methods
+            static_methods=static_methods,
+            flat_methods=flat_methods,
         )
     
     def get_class(self, name: str) -> Optional[ClassDefinition]:
@@ -142,16 +253,11 @@ class ClassRuntime:
         # Create environment for static method
         method_env = Environment(outer=method.env)
         
-        # Bind arguments
-        for i, param in enumerate(method.params):
-            if i < len(args):
-                method_env.define(param, args[i])
-            else:
-                method_env.define(param, None)
+        # Bind arguments; zip pads short calls with None in C
+        _bind_params(method_env, method.params, args)
         
         # Execute method
-        from .interpreter import evaluate
-        return evaluate(method.body, method_env)
+        return _body_runner()(method.body, method_env)
 
 
 # Global class runtime instance
@@ -0,0 +1,227 @@
+"""
+Bytecode compiler for Aegis
+Lowers the AST subset the tree-walking interpreter executes into a
+flat opcode array plus constant/name pools for the stack VM in vm.py.
+"""
+
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from . import ast_nodes as AST
+from .interpreter import _INFIX_OPS
+
+# Opcodes. Instructions are two array slots wide: opcode then operand
+# (0 when unused), so jump targets are plain array indices.
+LOAD_CONST = 0
+LOAD_NAME = 1
+STORE_NAME = 2      # env.define, value stays on the stack
+ASSIGN_NAME = 3     # env.assign, value stays on the stack
+STORE_RESULT = 4    # pop into the result register
+JUMP = 5
+JUMP_IF_FALSE = 6
+BINOP = 7           # operand: const index of the operator function
+PREFIX_NOT = 8
+PREFIX_NEG = 9
+CALL = 10           # operand: argument count
+MEMBER = 11         # operand: name index
+INDEX = 12
+BUILD_LIST = 13     # operand: element count
+BUILD_MAP = 14      # operand: const index of the keys tuple
+SET_MEMBER = 15     # operand: name index; pops object, value stays
+SET_INDEX = 16      # pops index and collection, value stays
+MAKE_FUNCTION = 17  # operand: const index of the FunctionDefinition
+RETURN = 18
+HALT = 19
+
+
+class CompileError(Exception):
+    pass
+
+
+@dataclass
+class Bytecode:
+    ops: array
+    consts: List[Any]
+    names: List[str]
+
+
+def compile_program(program: AST.Program) -> Bytecode:
+    """Compile a parsed program to bytecode for vm.execute."""
+    return _Compiler().compile(program)
+
+
+class _Compiler:
+    def __init__(self):
+        self.ops = array("i")
+        self.consts: List[Any] = []
+        self.names: List[str] = []
+        self._const_index: Dict[Any, int] = {}
+        self._name_index: Dict[str, int] = {}
+
+    def compile(self, program: AST.Program) -> Bytecode:
+        for stmt in program.body:
+            self._statement(stmt)
+        self._emit(HALT)
+        return Bytecode(ops=self.ops, consts=self.consts, names=self.names)
+
+    # -------------------- emission helpers --------------------
+
+    def _emit(self, op: int, arg: int = 0) -> int:
+        pos = len(self.ops)
+        self.ops.append(op)
+        self.ops.append(arg)
+        return pos
+
+    def _patch(self, pos: int, target: int) -> None:
+        self.ops[pos + 1] = target
+
+    def _const(self, value: Any) -> int:
+        try:
+            key = (type(value), value)
+            index = self._const_index.get(key)
+        except TypeError:
+            key = None
+            index = None
+        if index is None:
+            index = len(self.consts)
+            self.consts.append(value)
+            if key is not None:
+                self._const_index[key] = index
+        return index
+
+    def _name(self, name: str) -> int:
+        index = self._name_index.get(name)
+        if index is None:
+            index = len(self.names)
+            self.names.append(name)
+            self._name_index[name] = index
+        return index
+
+    # -------------------- statements --------------------
+
+    def _statement(self, node: AST.Node) -> None:
+        t = type(node)
+        if t is AST.ExpressionStatement:
+            self._expression(node.expression)
+            self._emit(STORE_RESULT)
+        elif t is AST.LetStatement:
+            self._expression(node.value)
+            self._emit(STORE_NAME, self._name(node.name))
+            self._emit(STORE_RESULT)
+        elif t is AST.AssignStatement:
+            self._assign(node)
+            self._emit(STORE_RESULT)
+        elif t is AST.ReturnStatement:
+            if node.value is not None:
+                self._expression(node.value)
+            else:
+                self._emit(LOAD_CONST, self._const(None))
+            self._emit(RETURN)
+        elif t is AST.IfStatement:
+            self._expression(node.test)
+            jump_false = self._emit(JUMP_IF_FALSE)
+            self._block(node.consequent)
+            jump_end = self._emit(JUMP)
+            self._patch(jump_false, len(self.ops))
+            if node.alternate is not None:
+                self._block(node.alternate)
+            else:
+                # the tree-walker yields None for a false test with no
+                # else branch
+                self._emit(LOAD_CONST, self._const(None))
+                self._emit(STORE_RESULT)
+            self._patch(jump_end, len(self.ops))
+        elif t is AST.WhileStatement:
+            # a loop whose body never runs yields None
+            self._emit(LOAD_CONST, self._const(None))
+            self._emit(STORE_RESULT)
+            loop_start = len(self.ops)
+            self._expression(node.test)
+            jump_false = self._emit(JUMP_IF_FALSE)
+            self._block(node.body)
+            self._emit(JUMP, loop_start)
+            self._patch(jump_false, len(self.ops))
+        elif t is AST.Block:
+            self._block(node)
+        else:
+            raise CompileError(f"Cannot compile statement {t.__name__}")
+
+    def _block(self, block: AST.Block) -> None:
+        if not block.statements:
+            self._emit(LOAD_CONST, self._const(None))
+            self._emit(STORE_RESULT)
+            return
+        for stmt in block.statements:
+            self._statement(stmt)
+
+    def _assign(self, node: AST.AssignStatement) -> None:
+        # value first, then the target object, matching the evaluation
+        # order of the tree-walker
+        target = node.target
+        self._expression(node.value)
+        if isinstance(target, AST.Identifier):
+            self._emit(ASSIGN_NAME, self._name(target.value))
+        elif isinstance(target, AST.MemberExpression):
+            self._expression(target.object)
+            self._emit(SET_MEMBER, self._name(target.property))
+        elif isinstance(target, AST.IndexExpression):
+            self._expression(target.collection)
+            self._expression(target.index)
+            self._emit(SET_INDEX)
+        else:
+            raise CompileError("Invalid assignment target")
+
+    # -------------------- expressions --------------------
+
+    def _expression(self, node: AST.Node) -> None:
+        t = type(node)
+        if t is AST.Identifier:
+            self._emit(LOAD_NAME, self._name(node.value))
+        elif t is AST.LiteralNode or t in (AST.NumberLiteral, AST.StringLiteral, AST.BooleanLiteral):
+            self._emit(LOAD_CONST, self._const(node.value))
+        elif t is AST.NullLiteral:
+            self._emit(LOAD_CONST, self._const(None))
+        elif t is AST.InfixExpression:
+            op_fn = _INFIX_OPS.get(node.operator)
+            if op_fn is None:
+                raise CompileError(f"Unknown operator {node.operator}")
+            self._expression(node.left)
+            self._expression(node.right)
+            self._emit(BINOP, self._const(op_fn))
+        elif t is AST.PrefixExpression:
+            self._expression(node.right)
+            if node.operator == "!":
+                self._emit(PREFIX_NOT)
+            elif node.operator == "-":
+                self._emit(PREFIX_NEG)
+            else:
+                raise CompileError(f"Unknown prefix operator {node.operator}")
+        elif t is AST.CallExpression:
+            self._expression(node.callee)
+            for arg in node.args:
+                self._expression(arg)
+            self._emit(CALL, len(node.args))
+        elif t is AST.MemberExpression:
+            self._expression(node.object)
+            self._emit(MEMBER, self._name(node.property))
+        elif t is AST.IndexExpression:
+            self._expression(node.collection)
+            self._expression(node.index)
+            self._emit(INDEX)
+        elif t is AST.ArrayLiteral:
+            for el in node.elements:
+                self._expression(el)
+            self._emit(BUILD_LIST, len(node.elements))
+        elif t is AST.ObjectLiteral:
+            keys = tuple(p.key for p in node.properties)
+            for prop in node.properties:
+                self._expression(prop.value)
+            self._emit(BUILD_MAP, self._const(keys))
+        elif t is AST.FunctionDefinition:
+            # function bodies stay as AST and run through the
+            # tree-walker when called
+            self._emit(MAKE_FUNCTION, self._const(node))
+        else:
+            raise CompileError(f"Cannot compile expression {t.__name__}")
@@ -53,6 +53,23 @@ class RuntimeError(AegisError):
     pass
 
 
+# Dispatch table for create_error; built once instead of an if/elif
+# chain with a .lower() comparison per arm
+_ERROR_CTORS: Dict[str, Any] = {
+    "type": TypeError,
+    "value": ValueError,
+    "reference": ReferenceError,
+    "syntax": SyntaxError,
+}
+
+# Lowercased type names for catch() matching, precomputed so checking
+# an exception doesn't rebuild str(type(...)).lower() every time
+_TYPE_NAME_CACHE: Dict[type, str] = {
+    cls: str(cls).lower()
+    for cls in (AegisError, TypeError, ValueError, ReferenceError, SyntaxError, RuntimeError)
+}
+
+
 class ErrorHandler:
     """Manages error handling and exception propagation."""
     
@@ -74,8 +91,12 @@ class ErrorHandler:
         if error_type is None:
             return True
         
-        # Simple type matching
-        return error_type.lower() in str(type(self.current_exception)).lower()
+        # Simple type matching against the cached lowercased type name
+        exc_type = type(self.current_exception)
+        type_name = _TYPE_NAME_CACHE.get(exc_type)
+        if type_name is None:
+            type_name = _TYPE_NAME_CACHE[exc_type] = str(exc_type).lower()
+        return error_type.lower() in type_name
     
     def get_exception(self) -> Optional[AegisError]:
         """Get the current exception."""
@@ -136,19 +157,9 @@ def make_error_functions() -> Dict[str, Any]:
         if not args:
             return RuntimeError("Unknown error")
         
-        error_type = args[0].lower()
         message = str(args[1]) if len(args) > 1 else "Error"
-        
-        if error_type == "type":
-            return TypeError(message)
-        elif error_type == "value":
-            return ValueError(message)
-        elif error_type == "reference":
-            return ReferenceError(message)
-        elif error_type == "syntax":
-            return SyntaxError(message)
-        else:
-            return RuntimeError(message)
+        ctor = _ERROR_CTORS.get(str(args[0]).lower(), RuntimeError)
+        return ctor(message)
     
     def get_exception_info(args: List[Any]) -> Any:
         """Native function to get current exception information."""
@@ -1,123 +1,383 @@
 from __future__ import annotations
-from typing import Any, List
+import dataclasses
+import operator
+from itertools import zip_longest
+from typing import Any, Callable, Dict, List
 from . import ast_nodes as AST
+from . import jit_compile
+from .class_runtime import ClassInstance
 from .runtime import Environment, FunctionValue, NativeFunction, ReturnSignal, RuntimeErrorAegis, is_truthy, deep_equal, enter_frame, exit_frame
 
 
 def evaluate(node: AST.Node, env: Environment) -> Any:
-    t = type(node)
-    if t is AST.Program:
-        result = None
-        for stmt in node.body:
-            result = evaluate(stmt, env)
-        return result
-    if t is AST.Block:
-        result = None
-        for stmt in node.statements:
-            result = evaluate(stmt, env)
-        return result
-    if t is AST.ExpressionStatement:
-        return evaluate(node.expression, env)
-    if t is AST.LetStatement:
-        value = evaluate(node.value, env)
-        env.define(node.name, value)
-        return value
-    if t is AST.AssignStatement:
-        value = evaluate(node.value, env)
-        _assign_target(node.target, value, env)
-        return value
-    if t is AST.Identifier:
-        return env.get(node.value)
-    if t is AST.NumberLiteral:
-        return node.value
-    if t is AST.StringLiteral:
-        return node.value
-    if t is AST.BooleanLiteral:
-        return node.value
-    if t is AST.NullLiteral:
-        return None
-    if t is AST.ArrayLiteral:
-        return [evaluate(el, env) for el in node.elements]
-    if t is AST.ObjectLiteral:
-        return {prop.key: evaluate(prop.value, env) for prop in node.properties}
-    if t is AST.PrefixExpression:
-        right = evaluate(node.right, env)
-        if node.operator == "!":
-            return not is_truthy(right)
-        if node.operator == "-":
-            return -_expect_number(right)
-        raise RuntimeErrorAegis(f"Unknown prefix operator {node.operator}")
-    if t is AST.InfixExpression:
-        left = evaluate(node.left, env)
-        right = evaluate(node.right, env)
-        op = node.operator
-        if op == "+":
-            return _binary_add(left, right)
-        if op == "-":
-            return _expect_number(left) - _expect_number(right)
-        if op == "*":
-            return _expect_number(left) * _expect_number(right)
-        if op == "/":
-            return _expect_number(left) / _expect_number(right)
-        if op == "%":
-            return _expect_number(left) % _expect_number(right)
-        if op == "==":
-            return deep_equal(left, right)
-        if op == "!=":
-            return not deep_equal(left, right)
-        if op == "<":
-            return _expect_number(left) < _expect_number(right)
-        if op == ">":
-            return _expect_number(left) > _expect_number(right)
-        if op == "<=":
-            return _expect_number(left) <= _expect_number(right)
-        if op == ">=":
-            return _expect_number(left) >= _expect_number(right)
-        if op == "&&":
-            return left if not is_truthy(left) else right
-        if op == "||":
-            return left if is_truthy(left) else right
-        if op == "NOR":
-            # Logical NOR: !(left || right). Preserve short-circuit semantics
-            if is_truthy(left):
-                return False
-            return not is_truthy(right)
-        if op == "IN":
-            try:
-                return left in right
-            except Exception:
-                return False
-        raise RuntimeErrorAegis(f"Unknown operator {op}")
-    if t is AST.CallExpression:
-        callee = evaluate(node.callee, env)
-        args = [evaluate(a, env) for a in node.args]
-        return _call(callee, args, env)
-    if t is AST.MemberExpression:
-        obj = evaluate(node.object, env)
-        return _get_member(obj, node.property)
-    if t is AST.IndexExpression:
-        coll = evaluate(node.collection, env)
-        idx = evaluate(node.index, env)
-        idx = _to_index(idx)
-        return coll[idx]
-    if t is AST.FunctionDefinition:
-        return FunctionValue(name=node.name, params=node.params, body=node.body, env=env)
-    if t is AST.ReturnStatement:
-        value = evaluate(node.value, env) if node.value is not None else None
-        raise ReturnSignal(value)
-    if t is AST.IfStatement:
-        test = evaluate(node.test, env)
-        if is_truthy(test):
-            return evaluate(node.consequent, env)
-        if node.alternate is not None:
-            return evaluate(node.alternate, env)
-        return None
-    if t is AST.WhileStatement:
-        result = None
-        while is_truthy(evaluate(node.test, env)):
-            result = evaluate(node.body, env)
+    # Monomorphic inline cache: a node's type never changes, so resolve
+    # its handler once and keep it on the node itself
+    handler = node._eval
+    if handler is None:
+        try:
+            handler = _DISPATCH[type(node)]
+        except KeyError:
+            raise RuntimeErrorAegis(f"Unknown node type {type(node)}")
+        node._eval = handler
+    return handler(node, env)
+
+
+# Comparison subset of _FAST_NUM_OPS used by the fused while loop
+_CMP_FAST: Dict[str, Any] = {
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+# Cooperative return channel: a return statement sets this flag and
+# parks its value instead of raising, so the common call/return pair
+# costs two global assignments rather than an exception unwind.
+# ReturnSignal is still honoured for externally built frames (the VM).
+_returning = False
+_return_value: Any = None
+
+
+def call_function_body(body: AST.Node, env: Environment) -> Any:
+    """Evaluate a function body and consume any pending return."""
+    global _returning
+    try:
+        result = evaluate(body, env)
+    except ReturnSignal as rs:
+        return rs.value
+    if _returning:
+        _returning = False
+        return _return_value
+    return result
+
+
+# -------------------- statement handlers --------------------
+
+def _resolve_handler(node: AST.Node) -> Callable[[Any, Environment], Any]:
+    handler = node._eval
+    if handler is None:
+        try:
+            handler = _DISPATCH[type(node)]
+        except KeyError:
+            raise RuntimeErrorAegis(f"Unknown node type {type(node)}")
+        node._eval = handler
+    return handler
+
+
+def _eval_program(node: AST.Program, env: Environment) -> Any:
+    handlers = node._handlers
+    if handlers is None:
+        handlers = node._handlers = [_resolve_handler(s) for s in node.body]
+    global _returning
+    result = None
+    for handler, stmt in zip(handlers, node.body):
+        result = handler(stmt, env)
+        if _returning:
+            # top-level return: surface it to the embedder as before
+            _returning = False
+            raise ReturnSignal(_return_value)
+    return result
+
+
+def _eval_block(node: AST.Block, env: Environment) -> Any:
+    handlers = node._handlers
+    if handlers is None:
+        handlers = node._handlers = [_resolve_handler(s) for s in node.statements]
+    result = None
+    for handler, stmt in zip(handlers, node.statements):
+        result = handler(stmt, env)
+        if _returning:
+            break
+    return result
+
+
+def _eval_expression_statement(node: AST.ExpressionStatement, env: Environment) -> Any:
+    return evaluate(node.expression, env)
+
+
+def _eval_let(node: AST.LetStatement, env: Environment) -> Any:
+    value = evaluate(node.value, env)
+    env.define(node.name, value)
+    return value
+
+
+def _eval_assign(node: AST.AssignStatement, env: Environment) -> Any:
+    value = evaluate(node.value, env)
+    _assign_target(node.target, value, env)
+    return value
+
+
+def _eval_return(node: AST.ReturnStatement, env: Environment) -> Any:
+    global _returning, _return_value
+    value = evaluate(node.value, env) if node.value is not None else None
+    _return_value = value
+    _returning = True
+    return value
+
+
+def _eval_if(node: AST.IfStatement, env: Environment) -> Any:
+    test = evaluate(node.test, env)
+    if is_truthy(test):
+        return evaluate(node.consequent, env)
+    if node.alternate is not None:
+        return evaluate(node.alternate, env)
+    return None
+
+
+def _eval_while(node: AST.WhileStatement, env: Environment) -> Any:
+    test, body = node.test, node.body
+    body_handler = _resolve_handler(body)
+    result = None
+    if type(test) is AST.InfixExpression and test.operator in _CMP_FAST:
+        # Fused loop for the dominant 'while (a < b)' shape: evaluate
+        # the operands and compare directly, skipping the dispatch of
+        # the test node and the generic truthiness check (comparisons
+        # yield real booleans)
+        cmp_fn = _CMP_FAST[test.operator]
+        left, right = test.left, test.right
+        left_handler = _resolve_handler(left)
+        right_handler = _resolve_handler(right)
+        generic_fn = _INFIX_OPS[test.operator]
+        while True:
+            l = left_handler(left, env)
+            r = right_handler(right, env)
+            if isinstance(l, (int, float)) and isinstance(r, (int, float)):
+                if not cmp_fn(l, r):
+                    break
+            elif not is_truthy(generic_fn(l, r)):
+                break
+            result = body_handler(body, env)
+            if _returning:
+                break
         return result
-    raise RuntimeErrorAegis(f"Unknown node type {t}")
+    test_handler = _resolve_handler(test)
+    while is_truthy(test_handler(test, env)):
+        result = body_handler(body, env)
+        if _returning:
+            break
+    return result
+
+
+# -------------------- expression handlers --------------------
+
+def _eval_identifier(node: AST.Identifier, env: Environment) -> Any:
+    slot = node._slot
+    if slot is not None:
+        slots = env.slots
+        if slots is not None:
+            return slots[slot]
+    return env.get(node.value)
+
+
+def _eval_literal(node: AST.Node, env: Environment) -> Any:
+    return node.value
+
+
+def _eval_null(node: AST.NullLiteral, env: Environment) -> Any:
+    return None
+
+
+def _eval_array(node: AST.ArrayLiteral, env: Environment) -> Any:
+    elements = node._elements_tuple
+    if elements is None:
+        elements = node._elements_tuple = tuple(node.elements)
+    return [evaluate(el, env) for el in elements]
+
+
+def _eval_object(node: AST.ObjectLiteral, env: Environment) -> Any:
+    keys = node._keys
+    if keys is None:
+        keys = node._keys = tuple(p.key for p in node.properties)
+        node._value_exprs = tuple(p.value for p in node.properties)
+    return dict(zip(keys, [evaluate(v, env) for v in node._value_exprs]))
+
+
+def _eval_prefix(node: AST.PrefixExpression, env: Environment) -> Any:
+    right = evaluate(node.right, env)
+    if node.operator == "!":
+        return not is_truthy(right)
+    if node.operator == "-":
+        return -_expect_number(right)
+    raise RuntimeErrorAegis(f"Unknown prefix operator {node.operator}")
+
+
+def _op_add(left: Any, right: Any) -> Any:
+    return _binary_add(left, right)
+
+
+def _op_sub(left: Any, right: Any) -> Any:
+    return _expect_number(left) - _expect_number(right)
+
+
+def _op_mul(left: Any, right: Any) -> Any:
+    return _expect_number(left) * _expect_number(right)
+
+
+def _op_div(left: Any, right: Any) -> Any:
+    return _expect_number(left) / _expect_number(right)
+
+
+def _op_mod(left: Any, right: Any) -> Any:
+    return _expect_number(left) % _expect_number(right)
+
+
+def _op_eq(left: Any, right: Any) -> Any:
+    # Identity short-circuit: the same object is always deep-equal to
+    # itself, so skip the structural walk (safe because deep_equal
+    # never treats an object as unequal to itself)
+    if left is right:
+        return True
+    return deep_equal(left, right)
+
+
+def _op_ne(left: Any, right: Any) -> Any:
+    if left is right:
+        return False
+    return not deep_equal(left, right)
+
+
+def _op_lt(left: Any, right: Any) -> Any:
+    return _expect_number(left) < _expect_number(right)
+
+
+def _op_gt(left: Any, right: Any) -> Any:
+    return _expect_number(left) > _expect_number(right)
+
+
+def _op_le(left: Any, right: Any) -> Any:
+    return _expect_number(left) <= _expect_number(right)
+
+
+def _op_ge(left: Any, right: Any) -> Any:
+    return _expect_number(left) >= _expect_number(right)
+
+
+def _op_and(left: Any, right: Any) -> Any:
+    return left if not is_truthy(left) else right
+
+
+def _op_or(left: Any, right: Any) -> Any:
+    return left if is_truthy(left) else right
+
+
+def _op_nor(left: Any, right: Any) -> Any:
+    # Logical NOR: !(left || right)
+    if is_truthy(left):
+        return False
+    return not is_truthy(right)
+
+
+def _op_in(left: Any, right: Any) -> Any:
+    try:
+        return left in right
+    except Exception:
+        return False
+
+
+# C-implemented operator functions for proven-numeric operands. The
+# second element says whether the fast path is exact for any numeric
+# pair: + and the comparisons are, while - * / % must see at least one
+# float because the generic path casts int operands to float.
+_FAST_NUM_OPS: Dict[str, Any] = {
+    "+": (operator.add, True),
+    "-": (operator.sub, False),
+    "*": (operator.mul, False),
+    "/": (operator.truediv, False),
+    "%": (operator.mod, False),
+    "<": (operator.lt, True),
+    ">": (operator.gt, True),
+    "<=": (operator.le, True),
+    ">=": (operator.ge, True),
+}
+
+
+_INFIX_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": _op_add,
+    "-": _op_sub,
+    "*": _op_mul,
+    "/": _op_div,
+    "%": _op_mod,
+    "==": _op_eq,
+    "!=": _op_ne,
+    "<": _op_lt,
+    ">": _op_gt,
+    "<=": _op_le,
+    ">=": _op_ge,
+    "&&": _op_and,
+    "||": _op_or,
+    "NOR": _op_nor,
+    "IN": _op_in,
+}
+
+
+def _eval_infix(node: AST.InfixExpression, env: Environment) -> Any:
+    left = evaluate(node.left, env)
+    right = evaluate(node.right, env)
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+        fast = node._fast_op
+        if fast is None:
+            fast = node._fast_op = _FAST_NUM_OPS.get(node.operator, False)
+        if fast is not False:
+            fn, always = fast
+            if always or type(left) is float or type(right) is float:
+                return fn(left, right)
+    op_fn = node._op_fn
+    if op_fn is None:
+        op_fn = _INFIX_OPS.get(node.operator)
+        if op_fn is None:
+            raise RuntimeErrorAegis(f"Unknown operator {node.operator}")
+        node._op_fn = op_fn
+    return op_fn(left, right)
+
+
+def _eval_call(node: AST.CallExpression, env: Environment) -> Any:
+    callee = evaluate(node.callee, env)
+    args = [evaluate(a, env) for a in node.args]
+    return _call(callee, args, env)
+
+
+def _eval_member(node: AST.MemberExpression, env: Environment) -> Any:
+    obj = evaluate(node.object, env)
+    return _get_member(obj, node.property)
+
+
+def _eval_index(node: AST.IndexExpression, env: Environment) -> Any:
+    coll = evaluate(node.collection, env)
+    idx = evaluate(node.index, env)
+    idx = _to_index(idx)
+    return coll[idx]
+
+
+def _eval_function_definition(node: AST.FunctionDefinition, env: Environment) -> Any:
+    return FunctionValue(name=node.name, params=node.params, body=node.body, env=env)
+
+
+_DISPATCH: Dict[type, Callable[[Any, Environment], Any]] = {
+    AST.Program: _eval_program,
+    AST.Block: _eval_block,
+    AST.ExpressionStatement: _eval_expression_statement,
+    AST.LetStatement: _eval_let,
+    AST.AssignStatement: _eval_assign,
+    AST.ReturnStatement: _eval_return,
+    AST.IfStatement: _eval_if,
+    AST.WhileStatement: _eval_while,
+    AST.Identifier: _eval_identifier,
+    AST.LiteralNode: _eval_literal,
+    # Legacy literal classes, still dispatchable for externally built ASTs
+    AST.NumberLiteral: _eval_literal,
+    AST.StringLiteral: _eval_literal,
+    AST.BooleanLiteral: _eval_literal,
+    AST.NullLiteral: _eval_null,
+    AST.ArrayLiteral: _eval_array,
+    AST.ObjectLiteral: _eval_object,
+    AST.PrefixExpression: _eval_prefix,
+    AST.InfixExpression: _eval_infix,
+    AST.CallExpression: _eval_call,
+    AST.MemberExpression: _eval_member,
+    AST.IndexExpression: _eval_index,
+    AST.FunctionDefinition: _eval_function_definition,
+}
 
 
 def _expect_number(value: Any) -> float:
@@ -138,12 +398,84 @@ def _binary_add(a: Any, b: Any) -> Any:
     if isinstance(a, (int, float)) and isinstance(b, (int, float)):
         return a + b
     if isinstance(a, str) or isinstance(b, str):
+        # Concatenating with an empty string can reuse the other side
+        # instead of copying it
+        if a == "":
+            return b if isinstance(b, str) else str(b)
+        if b == "":
+            return a if isinstance(a, str) else str(a)
         return str(a) + str(b)
     if isinstance(a, list) and isinstance(b, list):
         return a + b
     raise RuntimeErrorAegis("Unsupported + operands")
 
 
+# Reusable call environments for functions whose bodies cannot leak
+# them (no nested function definitions); avoids one Environment + dict
+# allocation per call on the hot path
+_env_pool: List[Environment] = []
+_ENV_POOL_MAX = 64
+
+_ESCAPE_NODE_TYPES = (AST.FunctionDefinition, AST.AsyncFunctionDefinition)
+
+
+def _body_escapes(body: AST.Node) -> bool:
+    """Whether a function body can capture its call environment."""
+    stack: List[AST.Node] = [body]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _ESCAPE_NODE_TYPES):
+            return True
+        for f in dataclasses.fields(node):
+            value = getattr(node, f.name)
+            if isinstance(value, AST.Node):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(v for v in value if isinstance(v, AST.Node))
+    return False
+
+
+def _prepare_call(callee: FunctionValue) -> None:
+    """One-time analysis of a function before its first call.
+
+    Marks the function as slot-bindable when it is closure-free and no
+    let statement shadows a parameter, and annotates every parameter
+    Identifier in the body with its integer slot index.
+    """
+    escapes = _body_escapes(callee.body)
+    callee._escapes = escapes
+    if escapes or not callee.params:
+        callee._slotted = False
+        return
+
+    param_index = {name: i for i, name in enumerate(callee.params)}
+    identifiers: List[AST.Identifier] = []
+    stack: List[AST.Node] = [callee.body]
+    while stack:
+        node = stack.pop()
+        t = type(node)
+        if t is AST.Identifier:
+            identifiers.append(node)
+            continue
+        if t is AST.LetStatement and node.name in param_index:
+            # A let shadowing a parameter would split reads between the
+            # slot array and the store; keep the dict path instead
+            callee._slotted = False
+            return
+        for f in dataclasses.fields(node):
+            value = getattr(node, f.name)
+            if isinstance(value, AST.Node):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(v for v in value if isinstance(v, AST.Node))
+
+    for ident in identifiers:
+        slot = param_index.get(ident.value)
+        if slot is not None:
+            ident._slot = slot
+    callee._slotted = True
+
+
 def _call(callee: Any, args: List[Any], env: Environment) -> Any:
     if isinstance(callee, NativeFunction):
         # Frame management happens inside NativeFunction.__call__
@@ -151,27 +483,72 @@ def _call(callee: Any, args: List[Any], env: Environment) -> Any:
     if isinstance(callee, FunctionValue):
         frame_name = callee.name or "<anonymous>"
         enter_frame(frame_name)
-        try:
-            call_env = Environment(outer=callee.env)
-            for i, name in enumerate(callee.params):
-                call_env.define(name, args[i] if i < len(args) else None)
+        if callee._jit is None:
+            callee._jit = jit_compile.try_compile(callee) or False
+        if callee._jit is not False:
             try:
-                return evaluate(callee.body, call_env)
-            except ReturnSignal as rs:
-                return rs.value
+                result = callee._jit(args)
+            except jit_compile.JitFallback:
+                # Non-numeric arguments this time; take the generic path
+                pass
+            except BaseException:
+                exit_frame()
+                raise
+            else:
+                exit_frame()
+                return result
+        if callee._escapes is None:
+            _prepare_call(callee)
+        escapes = callee._escapes
+        if not escapes and _env_pool:
+            call_env = _env_pool.pop()
+            call_env.outer = callee.env
+        else:
+            call_env = Environment(outer=callee.env)
+        try:
+            if callee._slotted:
+                nparams = len(callee.params)
+                slots = list(args[:nparams])
+                if len(slots) < nparams:
+                    slots.extend([None] * (nparams - len(slots)))
+                call_env.slots = slots
+            else:
+                params = callee.params
+                nparams = len(params)
+                if len(args) < nparams:
+                    # zip pads missing arguments with None in C instead
+                    # of a bounds check per parameter
+                    call_env.store.update(zip_longest(params, args))
+                else:
+                    call_env.store.update(zip(params, args))
+            return call_function_body(callee.body, call_env)
         finally:
+            if not escapes and len(_env_pool) < _ENV_POOL_MAX:
+                call_env.store.clear()
+                call_env.outer = None
+                call_env.slots = None
+                _env_pool.append(call_env)
             exit_frame()
     raise RuntimeErrorAegis("Attempt to call non-function")
 
 
+_MISSING = object()
+
+
 def _get_member(obj: Any, prop: str) -> Any:
     if isinstance(obj, dict):
         return obj.get(prop)
-    # native object with attributes
-    if hasattr(obj, prop):
-        return getattr(obj, prop)
-    if isinstance(obj, list) and prop == "length":
+    if isinstance(obj, ClassInstance):
+        return obj.get_field(prop)
+    # lists have no 'length' attribute, so checking it first skips the
+    # attribute probe on the common arr.length access
+    if prop == "length" and isinstance(obj, list):
         return len(obj)
+    # native object with attributes; one getattr with a sentinel
+    # instead of the hasattr + getattr double MRO walk
+    value = getattr(obj, prop, _MISSING)
+    if value is not _MISSING:
+        return value
     raise RuntimeErrorAegis(f"Property '{prop}' not found")
 
 
@@ -179,6 +556,9 @@ def assign_to_member(obj: Any, prop: str, value: Any) -> None:
     if isinstance(obj, dict):
         obj[prop] = value
         return
+    if isinstance(obj, ClassInstance):
+        obj.set_field(prop, value)
+        return
     if hasattr(obj, prop):
         setattr(obj, prop, value)
         return
@@ -190,8 +570,11 @@ def assign_to_index(coll: Any, idx: Any, value: Any) -> None:
 
 
 def _assign_target(target: AST.Node, value: Any, env: Environment) -> None:
-    import inspect
     if isinstance(target, AST.Identifier):
+        slot = target._slot
+        if slot is not None and env.slots is not None:
+            env.slots[slot] = value
+            return
         env.assign(target.value, value)
         return
     if isinstance(target, AST.MemberExpression):
@@ -204,5 +587,3 @@ def _assign_target(target: AST.Node, value: Any, env: Environment) -> None:
         assign_to_index(coll, idx, value)
         return
     raise RuntimeErrorAegis("Invalid assignment target")
-
-
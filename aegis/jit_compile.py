@@ -0,0 +1,181 @@
+"""
+Numeric function compilation for Aegis
+Translates numeric-only function bodies into native Python functions
+(and, when numba is installed, machine code) on first call.
+"""
+
+from __future__ import annotations
+import keyword
+from typing import Any, List, Optional
+
+from . import ast_nodes as AST
+from .runtime import FunctionValue
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+# Operators whose numeric semantics we can reproduce exactly.
+# == and != are excluded: the interpreter's deep_equal distinguishes
+# int from float, which plain Python comparison does not.
+_ARITH_FLOAT_OPS = {"-": "-", "*": "*", "/": "/", "%": "%"}
+_CMP_OPS = {"<": "<", ">": ">", "<=": "<=", ">=": ">="}
+
+
+class _NotCompilable(Exception):
+    pass
+
+
+class JitFallback(Exception):
+    """Raised by a compiled wrapper when the arguments don't fit."""
+
+
+def try_compile(fn: FunctionValue) -> Optional[Any]:
+    """Compile a numeric-only function body to a Python callable.
+
+    Returns a wrapper taking the interpreter's args list, or None when
+    the body falls outside the numeric subset. The wrapper raises
+    JitFallback when called with non-numeric arguments so the caller
+    can take the tree-walking path instead.
+    """
+    params = list(fn.params)
+    if not params or len(set(params)) != len(params):
+        return None
+    for name in params:
+        if not _valid_name(name):
+            return None
+    body = fn.body
+    if not isinstance(body, AST.Block) or not body.statements:
+        return None
+    if not isinstance(body.statements[-1], AST.ReturnStatement):
+        # Without a trailing return the interpreter yields the last
+        # statement's value; a compiled function would return None
+        return None
+
+    try:
+        gen = _CodeGen(set(params))
+        lines = gen.emit_block(body, indent=1)
+    except _NotCompilable:
+        return None
+
+    src = "def _compiled(%s):\n%s" % (", ".join(params), "\n".join(lines))
+    namespace: dict = {}
+    try:
+        exec(compile(src, "<aegis-jit>", "exec"), namespace)
+    except SyntaxError:
+        return None
+    compiled = namespace["_compiled"]
+    if _njit is not None:
+        try:
+            compiled = _njit(cache=True)(compiled)
+        except Exception:
+            pass
+
+    nparams = len(params)
+
+    def wrapper(args: List[Any], _compiled=compiled, _n=nparams):
+        if len(args) != _n:
+            raise JitFallback()
+        for a in args:
+            if not isinstance(a, (int, float)):
+                raise JitFallback()
+        return _compiled(*args)
+
+    return wrapper
+
+
+def _valid_name(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+class _CodeGen:
+    """Emits Python source for the numeric AST subset."""
+
+    def __init__(self, names: set):
+        self.names = names
+
+    def emit_block(self, block: AST.Block, indent: int) -> List[str]:
+        lines: List[str] = []
+        for stmt in block.statements:
+            lines.extend(self.emit_statement(stmt, indent))
+        if not lines:
+            lines.append("    " * indent + "pass")
+        return lines
+
+    def emit_statement(self, node: AST.Node, indent: int) -> List[str]:
+        pad = "    " * indent
+        t = type(node)
+        if t is AST.ReturnStatement:
+            if node.value is None:
+                return [pad + "return None"]
+            return [pad + "return " + self.emit_expr(node.value)]
+        if t is AST.ExpressionStatement:
+            return [pad + self.emit_expr(node.expression)]
+        if t is AST.LetStatement:
+            if not _valid_name(node.name):
+                raise _NotCompilable()
+            line = pad + node.name + " = " + self.emit_expr(node.value)
+            self.names.add(node.name)
+            return [line]
+        if t is AST.AssignStatement:
+            target = node.target
+            if not isinstance(target, AST.Identifier) or not _valid_name(target.value):
+                raise _NotCompilable()
+            # Only names bound in this body may be assigned: compiling
+            # a write to an outer binding as a Python local would lose
+            # Environment.assign's outer-scope mutation
+            if target.value not in self.names:
+                raise _NotCompilable()
+            line = pad + target.value + " = " + self.emit_expr(node.value)
+            return [line]
+        if t is AST.IfStatement:
+            lines = [pad + "if " + self.emit_test(node.test) + ":"]
+            lines.extend(self.emit_block(node.consequent, indent + 1))
+            if node.alternate is not None:
+                lines.append(pad + "else:")
+                lines.extend(self.emit_block(node.alternate, indent + 1))
+            return lines
+        if t is AST.WhileStatement:
+            lines = [pad + "while " + self.emit_test(node.test) + ":"]
+            lines.extend(self.emit_block(node.body, indent + 1))
+            return lines
+        raise _NotCompilable()
+
+    def emit_test(self, node: AST.Node) -> str:
+        # Only boolean-producing comparisons may be tests: is_truthy
+        # treats 0 as true, so a bare numeric condition would change
+        # meaning under Python truthiness
+        if type(node) is AST.InfixExpression and node.operator in _CMP_OPS:
+            return self.emit_expr(node)
+        raise _NotCompilable()
+
+    def emit_expr(self, node: AST.Node) -> str:
+        t = type(node)
+        if t is AST.LiteralNode or t is AST.NumberLiteral:
+            value = node.value
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise _NotCompilable()
+            return repr(value)
+        if t is AST.Identifier:
+            if node.value not in self.names:
+                raise _NotCompilable()
+            return node.value
+        if t is AST.PrefixExpression:
+            if node.operator != "-":
+                raise _NotCompilable()
+            return "(-float(" + self.emit_expr(node.right) + "))"
+        if t is AST.InfixExpression:
+            op = node.operator
+            left = self.emit_expr(node.left)
+            right = self.emit_expr(node.right)
+            if op == "+":
+                # numeric + keeps native int/float types
+                return "(" + left + " + " + right + ")"
+            if op in _ARITH_FLOAT_OPS:
+                # the interpreter casts both operands to float here
+                return "(float(%s) %s float(%s))" % (left, _ARITH_FLOAT_OPS[op], right)
+            if op in _CMP_OPS:
+                return "(" + left + " " + _CMP_OPS[op] + " " + right + ")"
+            raise _NotCompilable()
+        raise _NotCompilable()
@@ -1,6 +1,8 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional, Dict, Set
+import re
+import sys
+from bisect import bisect_right
+from typing import Optional, Dict, List, NamedTuple, Set
 
 
 # Keyword handling: allow aliasing (e.g., def -> FN) and reserved domain terms
@@ -85,12 +87,45 @@ RESERVED_KEYWORDS: Set[str] = {
 }
 
 
-@dataclass
-class Token:
+# Unified keyword table: lowercased word -> (token type, literal
+# override or None to keep the source spelling). Folding the reserved
+# set and the word-operator normalization into one dict means a single
+# lookup per identifier. KEYWORD_TYPES wins where the two tables
+# overlap (e.g. 'override', 'break'), matching the old probe order.
+_LITERAL_OVERRIDES: Dict[str, str] = {
+    "and": "&&",
+    "or": "||",
+    "not": "!",
+    "is": "==",
+    "nor": "NOR",
+    "in": "IN",
+}
+
+KEYWORD_TABLE: Dict[str, tuple] = {}
+for _kw in RESERVED_KEYWORDS:
+    KEYWORD_TABLE[_kw] = (_kw.upper(), None)
+for _kw, _type in KEYWORD_TYPES.items():
+    KEYWORD_TABLE[_kw] = (_type, _LITERAL_OVERRIDES.get(_kw))
+del _kw, _type
+
+# Interned keys give the lookup a cached hash and an identity-first
+# compare; the pre-bound method saves a global load plus attribute
+# fetch on every identifier token.
+KEYWORD_TABLE = {sys.intern(_k): _v for _k, _v in KEYWORD_TABLE.items()}
+_kw_lookup = KEYWORD_TABLE.get
+
+
+class Token(NamedTuple):
+    """One lexed token. A NamedTuple keeps tokens immutable and
+    __dict__-free: construction is a C-level tuple allocation and the
+    per-token footprint stays small for large sources."""
     type: str
     literal: str
     line: int
     col: int
+    # dense integer id for type (see TOKEN_KINDS); lets the parser
+    # dispatch through flat lists instead of string-keyed dicts
+    kind: int = -1
 
 
 SINGLE_CHAR_TOKENS = {
@@ -116,183 +151,357 @@ SINGLE_CHAR_TOKENS = {
 }
 
 
+# Compiled scanners for character runs; matching a whole span in C
+# replaces one Python-level loop iteration per character
+_WS_RE = re.compile(r"[ \t\r\n]+")
+_IDENT_RE = re.compile(r"\w+")
+_NUM_RE = re.compile(r"\d+(?:\.\d*)?")
+_STR_PLAIN_RE = re.compile(r'[^"\\]+')
+
+# ASCII character classes for next_token's first-char dispatch; a
+# frozenset probe beats the unicodedata-backed str.isdigit/str.isalpha
+# for the characters that actually occur in Aegis source. The is*
+# fallbacks below keep non-ASCII identifiers and digits working.
+_DIGITS = frozenset("0123456789")
+_IDENT_START = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+
+# First characters of two-char operators; gate the two-char slice so
+# most tokens never allocate it
+_OP2_STARTERS = frozenset("=!<>&|")
+
+_ESCAPES = {
+    'n': '\n', 'r': '\r', 't': '\t', '"': '"', "'": "'", "\\": "\\",
+}
+
+_TWO_CHAR_TOKENS = {
+    "==": "EQ",
+    "!=": "NEQ",
+    "<=": "LTE",
+    ">=": "GTE",
+    "&&": "AND",
+    "||": "OR",
+}
+
+# Operator lookups resolving straight to (type, interned literal).
+# Every "+" or "==" token shares one literal object instead of a fresh
+# source slice, so parser comparisons against these literals hit the
+# interned-string identity fast path.
+_OP1_TOKENS: Dict[str, tuple] = {
+    c: (sys.intern(t), sys.intern(c)) for c, t in SINGLE_CHAR_TOKENS.items()
+}
+_OP2_TOKENS: Dict[str, tuple] = {
+    s: (sys.intern(t), sys.intern(s)) for s, t in _TWO_CHAR_TOKENS.items()
+}
+
+# Dense integer ids for every token type. The parser indexes flat
+# lists by Token.kind, turning per-node dict probes into array loads.
+# The first five are fixed so the lexer can use them as constants.
+TOKEN_KINDS: Dict[str, int] = {
+    "EOF": 0, "ILLEGAL": 1, "IDENT": 2, "NUMBER": 3, "STRING": 4,
+}
+for _t in list(SINGLE_CHAR_TOKENS.values()) + list(_TWO_CHAR_TOKENS.values()):
+    if _t not in TOKEN_KINDS:
+        TOKEN_KINDS[_t] = len(TOKEN_KINDS)
+for _entry in KEYWORD_TABLE.values():
+    if _entry[0] not in TOKEN_KINDS:
+        TOKEN_KINDS[_entry[0]] = len(TOKEN_KINDS)
+del _t, _entry
+N_KINDS = len(TOKEN_KINDS)
+
+_K_EOF, _K_ILLEGAL, _K_IDENT, _K_NUMBER, _K_STRING = range(5)
+
+# Fold the kind into the resolution tables so emitting a token needs
+# no extra lookup. The interned key doubles as the literal for
+# lowercase keyword spellings, so every 'let' or 'while' token shares
+# one string instead of holding a fresh source slice.
+KEYWORD_TABLE = {
+    k: (t, lit, TOKEN_KINDS[t], k) for k, (t, lit) in KEYWORD_TABLE.items()
+}
+_kw_lookup = KEYWORD_TABLE.get
+_OP1_TOKENS = {c: (t, l, TOKEN_KINDS[t]) for c, (t, l) in _OP1_TOKENS.items()}
+_OP2_TOKENS = {s: (t, l, TOKEN_KINDS[t]) for s, (t, l) in _OP2_TOKENS.items()}
+
+
+# Master alternation for whole-source tokenization: one C-level regex
+# pass classifies every token. Order matters: terminated block strings
+# before unterminated ones, block strings before plain strings, and
+# two-char operators before their one-char prefixes.
+_MASTER_RE = re.compile(
+    r"(?P<WS>[ \t\r\n]+)"
+    r"|(?P<COMMENT>(?:\#|//|~)[^\n]*)"
+    r'|(?P<BSTR>""(?:\\.|"(?!")|[^"\\])*"")'
+    r'|(?P<BSTR_UNT>""(?:\\.|"(?!")|[^"\\])*\\?)'
+    r'|(?P<STR>"(?:\\.|[^"\\])*")'
+    r'|(?P<STR_UNT>"(?:\\.|[^"\\])*\\?)'
+    r"|(?P<NUM>\d+(?:\.\d*)?)"
+    r"|(?P<ID>[^\W\d]\w*)"
+    r"|(?P<OP2>==|!=|<=|>=|&&|\|\|)"
+    r"|(?P<OP1>[(){}\[\],:;.+\-*/%!<>=])",
+    re.S,
+)
+
+_UNESCAPE_RE = re.compile(r"\\(.)|\\$", re.S)
+
+
+def _line_starts(source: str) -> List[int]:
+    """Offsets where each line begins, for bisect-based position lookup.
+
+    Built once per source; line/col are then derived only at token
+    boundaries instead of being tracked across every scanned span.
+    """
+    starts = [0]
+    append = starts.append
+    find = source.find
+    i = find("\n")
+    while i != -1:
+        append(i + 1)
+        i = find("\n", i + 1)
+    return starts
+
+
+def _unescape(body: str) -> str:
+    if "\\" not in body:
+        return body
+    return _UNESCAPE_RE.sub(
+        lambda m: _ESCAPES.get(m.group(1), m.group(1)) if m.group(1) is not None else "",
+        body,
+    )
+
+
+def tokenize(source: str) -> List[Token]:
+    """Tokenize a whole source string in one pass over the master regex.
+
+    Produces the same stream as repeatedly calling Lexer.next_token,
+    including the trailing EOF token, but classification happens inside
+    the regex engine instead of per-character Python code.
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    match = _MASTER_RE.match
+    starts = _line_starts(source)
+    bisect = bisect_right
+    pos = 0
+    n = len(source)
+    while pos < n:
+        m = match(source, pos)
+        if m is None:
+            idx = bisect(starts, pos) - 1
+            append(Token("ILLEGAL", source[pos], idx + 1, pos - starts[idx] + 1, _K_ILLEGAL))
+            pos += 1
+            continue
+        end = m.end()
+        kind = m.lastgroup
+        if kind == "WS" or kind == "COMMENT":
+            # skipped spans need no bookkeeping at all
+            pos = end
+            continue
+        idx = bisect(starts, pos) - 1
+        line = idx + 1
+        col = pos - starts[idx]
+        text = m.group()
+        if kind == "ID":
+            # probe with the raw spelling first; keywords are defined
+            # lowercase, so only a miss on mixed-case input pays for
+            # the .lower() allocation
+            entry = _kw_lookup(text)
+            if entry is not None:
+                # raw-spelling hit: the spelling IS the table key, so
+                # the token shares the interned literal
+                tok_type, literal, k, spelling = entry
+                append(Token(tok_type, spelling if literal is None else literal, line, col + 1, k))
+            else:
+                if not text.islower():
+                    entry = _kw_lookup(text.lower())
+                if entry is not None:
+                    # mixed-case keyword keeps its source spelling
+                    tok_type, literal, k = entry[0], entry[1], entry[2]
+                    append(Token(tok_type, text if literal is None else literal, line, col + 1, k))
+                else:
+                    append(Token("IDENT", text, line, col + 1, _K_IDENT))
+        elif kind == "OP1":
+            tok_type, literal, k = _OP1_TOKENS[text]
+            append(Token(tok_type, literal, line, col + 1, k))
+        elif kind == "NUM":
+            append(Token("NUMBER", text, line, col + 1, _K_NUMBER))
+        elif kind == "OP2":
+            tok_type, literal, k = _OP2_TOKENS[text]
+            append(Token(tok_type, literal, line, col + 1, k))
+        elif kind == "BSTR":
+            append(Token("STRING", _unescape(text[2:-2]), line, col + 1, _K_STRING))
+        elif kind == "STR":
+            append(Token("STRING", _unescape(text[1:-1]), line, col + 1, _K_STRING))
+        elif kind == "BSTR_UNT":
+            append(Token("STRING", _unescape(text[2:]), line, col + 1, _K_STRING))
+        elif kind == "STR_UNT":
+            append(Token("STRING", _unescape(text[1:]), line, col + 1, _K_STRING))
+        pos = end
+    idx = bisect(starts, n) - 1
+    append(Token("EOF", "", idx + 1, n - starts[idx], _K_EOF))
+    return tokens
+
+
 class Lexer:
+    """Index-driven tokenizer: scans runs (whitespace, comments,
+    identifiers, numbers, string segments) with compiled regexes and
+    slicing instead of advancing one character at a time."""
+
     def __init__(self, source: str):
         self.source = source
-        self.position = 0
-        self.read_position = 0
-        self.ch: Optional[str] = None
-        self.line = 1
-        self.col = 0
-        self._read_char()
-
-    def _read_char(self) -> None:
-        if self.read_position >= len(self.source):
-            self.ch = None
-            return
-        self.ch = self.source[self.read_position]
-        self.position = self.read_position
-        self.read_position += 1
-        if self.ch == "\n":
-            self.line += 1
-            self.col = 0
-        else:
-            self.col += 1
-
-    def _peek_char(self) -> Optional[str]:
-        if self.read_position >= len(self.source):
-            return None
-        return self.source[self.read_position]
+        self.pos = 0
+        self._starts = _line_starts(source)
+
+    def _linecol(self, pos: int) -> tuple:
+        """1-based (line, col) of the character at pos, via bisect."""
+        starts = self._starts
+        idx = bisect_right(starts, pos) - 1
+        return idx + 1, pos - starts[idx] + 1
 
     def next_token(self) -> Token:
         self._skip_whitespace_and_comments()
-        if self.ch is None:
-            return Token("EOF", "", self.line, self.col)
-
-        start_line, start_col = self.line, self.col
-        # multi-char operators
-        two = (self.ch or "") + (self._peek_char() or "")
-        if two in {"==", "!=", "<=", ">=", "&&", "||"}:
-            tok = Token({
-                "==": "EQ",
-                "!=": "NEQ",
-                "<=": "LTE",
-                ">=": "GTE",
-                "&&": "AND",
-                "||": "OR",
-            }[two], two, start_line, start_col)
-            self._read_char()
-            self._read_char()
-            return tok
-
-        if self.ch in SINGLE_CHAR_TOKENS:
-            literal = self.ch
-            tok_type = SINGLE_CHAR_TOKENS[literal]
-            self._read_char()
-            return Token(tok_type, literal, start_line, start_col)
-
-        if self.ch == '"':
+        src = self.source
+        pos = self.pos
+        n = len(src)
+        if pos >= n:
+            line, col = self._linecol(n)
+            return Token("EOF", "", line, col - 1, _K_EOF)
+
+        start_line, start_col = self._linecol(pos)
+        c = src[pos]
+        # multi-char operators; only slice when the first char can
+        # actually start one
+        if c in _OP2_STARTERS:
+            entry = _OP2_TOKENS.get(src[pos:pos + 2])
+            if entry is not None:
+                self.pos = pos + 2
+                return Token(entry[0], entry[1], start_line, start_col, entry[2])
+
+        entry = _OP1_TOKENS.get(c)
+        if entry is not None:
+            self.pos = pos + 1
+            return Token(entry[0], entry[1], start_line, start_col, entry[2])
+
+        if c == '"':
             # Support block strings delimited by ""...""
-            if self._peek_char() == '"':
-                value = self._read_block_string()
+            if pos + 1 < n and src[pos + 1] == '"':
+                value = self._scan_block_string(pos)
             else:
-                value = self._read_string()
-            return Token("STRING", value, start_line, start_col)
-
-        if self.ch.isdigit():
-            value = self._read_number()
-            return Token("NUMBER", value, start_line, start_col)
-
-        if self.ch.isalpha() or self.ch == "_":
-            ident = self._read_identifier()
-            lt = ident.lower()
-            if lt in KEYWORD_TYPES:
-                tok_type = KEYWORD_TYPES[lt]
-                # normalize literals for word operators to match interpreter semantics
-                if lt == "and":
-                    return Token("AND", "&&", start_line, start_col)
-                if lt == "or":
-                    return Token("OR", "||", start_line, start_col)
-                if lt == "not":
-                    return Token("BANG", "!", start_line, start_col)
-                if lt == "is":
-                    return Token("EQ", "==", start_line, start_col)
-                if lt == "nor":
-                    return Token("NOR", "NOR", start_line, start_col)
-                if lt == "in":
-                    return Token("IN", "IN", start_line, start_col)
-                # others keep their original literal text
-                return Token(tok_type, ident, start_line, start_col)
-            if lt in RESERVED_KEYWORDS:
-                return Token(lt.upper(), ident, start_line, start_col)
-            return Token("IDENT", ident, start_line, start_col)
+                value = self._scan_string(pos)
+            return Token("STRING", value, start_line, start_col, _K_STRING)
+
+        if c in _DIGITS or c.isdigit():
+            m = _NUM_RE.match(src, pos)
+            if m is not None:
+                end = m.end()
+                self.pos = end
+                return Token("NUMBER", src[pos:end], start_line, start_col, _K_NUMBER)
+
+        if c in _IDENT_START or c.isalpha():
+            end = _IDENT_RE.match(src, pos).end()
+            ident = src[pos:end]
+            self.pos = end
+            # probe with the raw spelling first; keywords are defined
+            # lowercase, so only a miss on mixed-case input pays for
+            # the .lower() allocation
+            entry = _kw_lookup(ident)
+            if entry is not None:
+                # raw-spelling hit: share the interned table spelling
+                tok_type, literal, kind, spelling = entry
+                return Token(tok_type, spelling if literal is None else literal, start_line, start_col, kind)
+            if not ident.islower():
+                entry = _kw_lookup(ident.lower())
+                if entry is not None:
+                    # mixed-case keyword keeps its source spelling
+                    return Token(entry[0], ident if entry[1] is None else entry[1], start_line, start_col, entry[2])
+            return Token("IDENT", ident, start_line, start_col, _K_IDENT)
 
         # unknown char
-        illegal = self.ch
-        self._read_char()
-        return Token("ILLEGAL", illegal, start_line, start_col)
+        self.pos = pos + 1
+        return Token("ILLEGAL", c, start_line, start_col, _K_ILLEGAL)
 
     def _skip_whitespace_and_comments(self) -> None:
-        while self.ch is not None:
-            if self.ch in " \t\r\n":
-                self._read_char()
+        src = self.source
+        pos = self.pos
+        n = len(src)
+        while pos < n:
+            m = _WS_RE.match(src, pos)
+            if m is not None:
+                end = m.end()
+                pos = end
                 continue
-            # line comment starting with #
-            if self.ch == "#":
-                while self.ch is not None and self.ch != "\n":
-                    self._read_char()
-                continue
-            # line comment starting with //
-            if self.ch == "/" and self._peek_char() == "/":
-                while self.ch is not None and self.ch != "\n":
-                    self._read_char()
-                continue
-            # line comment starting with ~
-            if self.ch == "~":
-                while self.ch is not None and self.ch != "\n":
-                    self._read_char()
+            c = src[pos]
+            # line comments: #, //, or ~ up to (not including) newline
+            if c == "#" or c == "~" or (c == "/" and src.startswith("//", pos)):
+                end = src.find("\n", pos)
+                if end == -1:
+                    end = n
+                pos = end
                 continue
             break
+        self.pos = pos
 
-    def _read_string(self) -> str:
-        # consume opening quote
-        self._read_char()
-        chars = []
-        while self.ch is not None and self.ch != '"':
-            if self.ch == "\\":
-                self._read_char()
-                if self.ch is None:
-                    break
-                escapes = {
-                    'n': '\n', 'r': '\r', 't': '\t', '"': '"', "'": "'", "\\": "\\",
-                }
-                chars.append(escapes.get(self.ch, self.ch))
-            else:
-                chars.append(self.ch)
-            self._read_char()
-        # consume closing quote
-        if self.ch == '"':
-            self._read_char()
-        return "".join(chars)
-
-    def _read_block_string(self) -> str:
-        # consume opening double quotes ""
-        self._read_char()  # first '"'
-        self._read_char()  # second '"'
-        chars = []
-        while self.ch is not None:
-            # end delimiter: two consecutive quotes
-            if self.ch == '"' and self._peek_char() == '"':
-                self._read_char()  # first closing '"'
-                self._read_char()  # second closing '"'
+    def _scan_string(self, start: int) -> str:
+        src = self.source
+        n = len(src)
+        pos = start + 1  # skip opening quote
+        # fast path: closing quote with no escape in between means the
+        # body is a single slice, no run loop or join needed
+        end = src.find('"', pos)
+        if end != -1 and src.find("\\", pos, end) == -1:
+            self.pos = end + 1
+            return src[pos:end]
+        parts = []
+        while pos < n:
+            m = _STR_PLAIN_RE.match(src, pos)
+            if m is not None:
+                parts.append(m.group())
+                pos = m.end()
+                continue
+            c = src[pos]
+            if c == '"':
+                pos += 1  # closing quote
                 break
-            if self.ch == "\\":
-                # allow basic escapes inside block strings too
-                self._read_char()
-                if self.ch is None:
+            # backslash escape; a dangling one at EOF is dropped
+            if pos + 1 < n:
+                nxt = src[pos + 1]
+                parts.append(_ESCAPES.get(nxt, nxt))
+            pos += 2
+        pos = min(pos, n)
+        self.pos = pos
+        return "".join(parts)
+
+    def _scan_block_string(self, start: int) -> str:
+        src = self.source
+        n = len(src)
+        pos = start + 2  # skip opening ""
+        # fast path: end delimiter with no escape before it; lone
+        # quotes inside the body are literal either way
+        end = src.find('""', pos)
+        if end != -1 and src.find("\\", pos, end) == -1:
+            self.pos = end + 2
+            return src[pos:end]
+        parts = []
+        while pos < n:
+            m = _STR_PLAIN_RE.match(src, pos)
+            if m is not None:
+                parts.append(m.group())
+                pos = m.end()
+                continue
+            c = src[pos]
+            if c == '"':
+                # end delimiter: two consecutive quotes
+                if pos + 1 < n and src[pos + 1] == '"':
+                    pos += 2
                     break
-                escapes = {
-                    'n': '\n', 'r': '\r', 't': '\t', '"': '"', "'": "'", "\\": "\\",
-                }
-                chars.append(escapes.get(self.ch, self.ch))
-            else:
-                chars.append(self.ch)
-            self._read_char()
-        return "".join(chars)
-
-    def _read_number(self) -> str:
-        start = self.position
-        has_dot = False
-        while self.ch is not None and (self.ch.isdigit() or (self.ch == "." and not has_dot)):
-            if self.ch == ".":
-                has_dot = True
-            self._read_char()
-        return self.source[start:self.position]
-
-    def _read_identifier(self) -> str:
-        start = self.position
-        while self.ch is not None and (self.ch.isalnum() or self.ch == "_"):
-            self._read_char()
-        return self.source[start:self.position]
+                parts.append('"')
+                pos += 1
+                continue
+            # allow basic escapes inside block strings too
+            if pos + 1 < n:
+                nxt = src[pos + 1]
+                parts.append(_ESCAPES.get(nxt, nxt))
+            pos += 2
+        pos = min(pos, n)
+        self.pos = pos
+        return "".join(parts)
 
 
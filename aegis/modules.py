@@ -1,44 +1,71 @@
 from __future__ import annotations
+import hashlib
+import pickle
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any
 
 from .parser import parse
 from .interpreter import evaluate
 
 
-class ModuleCache:
-    def __init__(self):
-        self.cache: Dict[str, Any] = {}
+# On-disk cache of parsed module ASTs, keyed by resolved path and
+# invalidated by file mtime. A fresh process then skips lex+parse for
+# unchanged modules, like CPython's __pycache__. The tag guards against
+# stale pickles across interpreter or AST-layout changes.
+_AST_CACHE_DIR = Path("~/.aegis/astcache").expanduser()
+_CACHE_TAG = ("aegis-1.0.0", sys.version_info[:2], pickle.HIGHEST_PROTOCOL)
 
-    def has(self, key: str) -> bool:
-        return key in self.cache
 
-    def get(self, key: str) -> Any:
-        return self.cache.get(key)
+def _load_program(p: Path, full: str) -> Any:
+    """Parse the module at p, reusing the on-disk AST cache when fresh."""
+    try:
+        mtime = p.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    cache_file = _AST_CACHE_DIR / (hashlib.sha1(full.encode("utf-8")).hexdigest() + ".ast.pkl")
+    header = (_CACHE_TAG, mtime)
+    if mtime is not None:
+        try:
+            with open(cache_file, "rb") as f:
+                stored_header, program = pickle.load(f)
+            if stored_header == header:
+                return program
+        except Exception:
+            pass  # missing, unreadable or stale cache: fall through to parse
+    program = parse(p.read_text(encoding="utf-8"))
+    if mtime is not None:
+        try:
+            _AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump((header, program), f, pickle.HIGHEST_PROTOCOL)
+            tmp.replace(cache_file)
+        except Exception:
+            pass  # caching is best-effort; the parse result is still good
+    return program
 
-    def set(self, key: str, value: Any) -> None:
-        self.cache[key] = value
 
+# In-process module cache: lru_cache keyed by the resolved path is a
+# single C-level dict probe per require, atomic under the GIL, and
+# exposes cache_clear for tests.
+@lru_cache(maxsize=None)
+def _load_module(full: str) -> Any:
+    # Lazy import to avoid circular dependency with env
+    from .env import make_global_env  # type: ignore
 
-_module_cache = ModuleCache()
+    p = Path(full)
+    program = _load_program(p, full)
+    env = make_global_env()
+    return evaluate(program, env)
 
 
 def require(path_like: str) -> Any:
-    # Lazy import to avoid circular dependency with env
-    from .env import make_global_env  # type: ignore
-
     p = Path(path_like)
     if p.suffix == "":
         p = p.with_suffix(".aeg")
-    full = str(p.resolve())
-    if _module_cache.has(full):
-        return _module_cache.get(full)
-    source = p.read_text(encoding="utf-8")
-    program = parse(source)
-    env = make_global_env()
-    result = evaluate(program, env)
-    _module_cache.set(full, result)
-    return result
+    return _load_module(str(p.resolve()))
 
 
 def load_file(path_like: str) -> Any:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 from typing import List, Optional, Callable, Dict
-from .lexer import Lexer, Token
+from .lexer import Lexer, Token, tokenize, TOKEN_KINDS, N_KINDS
 from .ast_nodes import (
     Program, Block, LetStatement, AssignStatement, IfStatement, WhileStatement,
     ReturnStatement, FunctionDefinition, ExpressionStatement, Identifier,
-    NumberLiteral, StringLiteral, BooleanLiteral, NullLiteral, ArrayLiteral,
+    LiteralNode, ArrayLiteral,
     ObjectLiteral, ObjectProperty, PrefixExpression, InfixExpression,
     CallExpression, IndexExpression, MemberExpression, Node
 )
@@ -21,6 +21,13 @@ PRECEDENCES: Dict[str, int] = {
     "DOT": 7, "LBRACKET": 7, "LPAREN": 7,
 }
 
+# Precedences as a flat list indexed by Token.kind; an array load per
+# operator instead of a string-keyed dict probe
+_PREC_BY_KIND: List[int] = [0] * N_KINDS
+for _t, _p in PRECEDENCES.items():
+    _PREC_BY_KIND[TOKEN_KINDS[_t]] = _p
+del _t, _p
+
 
 class ParseError(Exception):
     pass
@@ -29,11 +36,27 @@ class ParseError(Exception):
 class Parser:
     def __init__(self, lexer: Lexer):
         self.lexer = lexer
-        self.cur: Token = self.lexer.next_token()
-        self.peek: Token = self.lexer.next_token()
-
-        self.prefix_parse_fns: Dict[str, Callable[[], Node]] = {}
-        self.infix_parse_fns: Dict[str, Callable[[Node], Node]] = {}
+        # The token stream is consumed strictly left to right, so
+        # materialize it once up front; _advance is then a list index
+        # instead of a next_token() call per token
+        if lexer.pos == 0:
+            tokens = tokenize(lexer.source)
+        else:
+            # partially consumed lexer: drain whatever remains
+            tokens = []
+            while True:
+                tok = lexer.next_token()
+                tokens.append(tok)
+                if tok.type == "EOF":
+                    break
+        self.tokens: List[Token] = tokens
+        self.i = 0
+        self.cur: Token = tokens[0]
+        self.peek: Token = tokens[1] if len(tokens) > 1 else tokens[0]
+
+        # Parse-function dispatch: flat lists indexed by Token.kind
+        self.prefix_parse_fns: List[Optional[Callable[[], Node]]] = [None] * N_KINDS
+        self.infix_parse_fns: List[Optional[Callable[[Node], Node]]] = [None] * N_KINDS
 
         self._register_prefix("IDENT", self._parse_identifier)
         self._register_prefix("NUMBER", self._parse_number)
@@ -56,9 +79,25 @@ class Parser:
         self._register_infix("LBRACKET", self._parse_index)
         self._register_infix("DOT", self._parse_member)
 
+        # Statement dispatch, kind-indexed like the expression tables;
+        # anything unregistered parses as an expression statement
+        self._stmt_dispatch: List[Optional[Callable[[], Node]]] = [None] * N_KINDS
+        for t, fn in (("SET", self._parse_set_statement),
+                      ("RETURN", self._parse_return_statement),
+                      ("IF", self._parse_if_statement),
+                      ("UNLESS", self._parse_unless_statement),
+                      ("UNTIL", self._parse_until_statement),
+                      ("WHILE", self._parse_while_statement),
+                      ("FN", self._parse_function_declaration_statement)):
+            self._stmt_dispatch[TOKEN_KINDS[t]] = fn
+
     def _advance(self) -> None:
         self.cur = self.peek
-        self.peek = self.lexer.next_token()
+        i = self.i + 1
+        if i + 1 < len(self.tokens):
+            self.i = i
+            self.peek = self.tokens[i + 1]
+        # past the end, cur and peek both stay on the trailing EOF
 
     def _expect(self, token_type: str) -> Token:
         if self.cur.type != token_type:
@@ -68,16 +107,16 @@ class Parser:
         return tok
 
     def _current_precedence(self) -> int:
-        return PRECEDENCES.get(self.cur.type, 0)
+        return _PREC_BY_KIND[self.cur.kind]
 
     def _peek_precedence(self) -> int:
-        return PRECEDENCES.get(self.peek.type, 0)
+        return _PREC_BY_KIND[self.peek.kind]
 
     def _register_prefix(self, token_type: str, fn: Callable[[], Node]) -> None:
-        self.prefix_parse_fns[token_type] = fn
+        self.prefix_parse_fns[TOKEN_KINDS[token_type]] = fn
 
     def _register_infix(self, token_type: str, fn: Callable[[Node], Node]) -> None:
-        self.infix_parse_fns[token_type] = fn
+        self.infix_parse_fns[TOKEN_KINDS[token_type]] = fn
 
     def parse_program(self) -> Program:
         statements: List[Node] = []
@@ -92,23 +131,9 @@ class Parser:
         return Program(line=start_line, col=start_col, body=statements)
 
     def _parse_statement(self) -> Node:
-        if self.cur.type == "LET":
-            return self._parse_let_statement()
-        if self.cur.type == "SET":
-            return self._parse_set_statement()
-        if self.cur.type == "RETURN":
-            return self._parse_return_statement()
-        if self.cur.type == "IF":
-            return self._parse_if_statement()
-        if self.cur.type == "UNLESS":
-            return self._parse_unless_statement()
-        if self.cur.type == "UNTIL":
-            return self._parse_until_statement()
-        if self.cur.type == "WHILE":
-            return self._parse_while_statement()
-        if self.cur.type == "FN":
-            # function declaration statement: fn name(...) { ... }
-            return self._parse_function_declaration_statement()
+        fn = self._stmt_dispatch[self.cur.kind]
+        if fn is not None:
+            return fn()
         # expression statement
         expr = self._parse_expression(0)
         node = ExpressionStatement(line=expr.line, col=expr.col, expression=expr)
@@ -189,20 +214,12 @@ class Parser:
             self._advance()
             final_alt = self._parse_block()
 
-        # Build nested chain if we have however-clauses
-        alternate: Optional[Block] = None
-        if elif_list:
-            # Build from the last however upward
-            cur_if: IfStatement
-            last_test, last_block = elif_list[-1]
-            cur_if = IfStatement(line=start_line, col=start_col, test=last_test, consequent=last_block, alternate=final_alt)
-            # Wrap remaining however clauses
-            for t, b in reversed(elif_list[:-1]):
-                cur_if = IfStatement(line=start_line, col=start_col, test=t, consequent=b, alternate=Block(line=start_line, col=start_col, statements=[cur_if]))
-            # Set base alternate to a block containing the chain
-            alternate = Block(line=start_line, col=start_col, statements=[cur_if])
-        else:
-            alternate = final_alt
+        # Fold however-clauses into a chain of alternates, last first.
+        # The evaluator accepts any node as alternate, so no Block
+        # wrapper (and its statement list) is allocated per clause.
+        alternate: Optional[Node] = final_alt
+        for t, b in reversed(elif_list):
+            alternate = IfStatement(line=start_line, col=start_col, test=t, consequent=b, alternate=alternate)
         return IfStatement(line=start_line, col=start_col, test=test, consequent=consequent, alternate=alternate)
 
     def _parse_unless_statement(self) -> IfStatement:
@@ -254,49 +271,53 @@ class Parser:
         return AssignStatement(line=start_line, col=start_col, target=ident, value=func)
 
     def _parse_expression(self, precedence: int) -> Node:
-        prefix = self.prefix_parse_fns.get(self.cur.type)
+        prefix = self.prefix_parse_fns[self.cur.kind]
         if prefix is None:
             raise ParseError(f"No prefix parse function for {self.cur.type} at {self.cur.line}:{self.cur.col}")
         left = prefix()
 
-        while self.cur.type not in ("SEMICOLON", "EOF", "RBRACE") and precedence < self._current_precedence():
-            infix = self.infix_parse_fns.get(self.cur.type)
+        # Hoisted locals for the precedence-climbing loop. The old
+        # explicit SEMICOLON/EOF/RBRACE stop check is subsumed by the
+        # precedence test: those kinds all sit at precedence 0 and
+        # `precedence` is never negative.
+        prec = _PREC_BY_KIND
+        infix_fns = self.infix_parse_fns
+        while True:
+            kind = self.cur.kind
+            if precedence >= prec[kind]:
+                return left
+            infix = infix_fns[kind]
             if infix is None:
                 return left
             left = infix(left)
-        return left
 
     # prefix parse fns
     def _parse_identifier(self) -> Identifier:
         tok = self._expect("IDENT")
         return Identifier(line=tok.line, col=tok.col, value=tok.literal)
 
-    def _parse_number(self) -> NumberLiteral:
+    def _parse_number(self) -> LiteralNode:
         tok = self._expect("NUMBER")
         lit = tok.literal
-        if "." in lit:
-            val = float(lit)
-        else:
-            try:
-                val = int(lit)
-            except ValueError:
-                val = float(lit)
-        return NumberLiteral(line=tok.line, col=tok.col, value=val)
+        # the lexer only emits digits with at most one dot, so int()
+        # cannot fail and no try/except is needed
+        return LiteralNode(line=tok.line, col=tok.col,
+                           value=float(lit) if "." in lit else int(lit))
 
-    def _parse_string(self) -> StringLiteral:
+    def _parse_string(self) -> LiteralNode:
         tok = self._expect("STRING")
-        return StringLiteral(line=tok.line, col=tok.col, value=tok.literal)
+        return LiteralNode(line=tok.line, col=tok.col, value=tok.literal)
 
-    def _parse_boolean(self) -> BooleanLiteral:
+    def _parse_boolean(self) -> LiteralNode:
         if self.cur.type == "TRUE":
             tok = self._expect("TRUE")
-            return BooleanLiteral(line=tok.line, col=tok.col, value=True)
+            return LiteralNode(line=tok.line, col=tok.col, value=True)
         tok = self._expect("FALSE")
-        return BooleanLiteral(line=tok.line, col=tok.col, value=False)
+        return LiteralNode(line=tok.line, col=tok.col, value=False)
 
-    def _parse_null(self) -> NullLiteral:
+    def _parse_null(self) -> LiteralNode:
         tok = self._expect("NULL")
-        return NullLiteral(line=tok.line, col=tok.col)
+        return LiteralNode(line=tok.line, col=tok.col, value=None)
 
     def _parse_prefix(self) -> PrefixExpression:
         tok = self.cur
@@ -1,11 +1,46 @@
 from __future__ import annotations
+import atexit
+import datetime
+import hashlib
+import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+
 from pathlib import Path
 from .parser import parse, ParseError
 from .runtime import RuntimeErrorAegis, current_stack
 from .interpreter import evaluate
 from .env import make_global_env
 
+# Same optional dependency as jit_compile: when numba is installed the
+# brace-balance scanner runs as native code, otherwise plain Python
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+# Re-running the same snippet or file is common at the prompt; caching
+# the parse keyed on the exact source skips lex+parse on repeats.
+# Sharing the Program is safe: evaluation only fills internal dispatch
+# caches on nodes, it never rewrites the tree.
+@lru_cache(maxsize=256)
+def _parse_cached(src: str):
+    return parse(src)
+
+
+# Keyed on (path, mtime, size) so re-loading an unchanged file skips
+# the disk read as well
+@lru_cache(maxsize=32)
+def _read_source(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
 
 HELP = """
 Commands:
@@ -18,16 +53,202 @@ Multiline: end a block with a closing brace '}'.
 """.strip()
 
 
+def _emit(*lines: str) -> None:
+    """Write several output lines with one stdout call instead of one
+    print (lock + format + write) per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# ---------------- Dot commands ----------------
+# Each handler takes the argument tail (possibly empty) and the env,
+# and returns True to continue the REPL loop or False to exit.
+
+def _cmd_help(rest: list[str], env) -> bool:
+    print(HELP)
+    return True
+
+
+def _cmd_exit(rest: list[str], env) -> bool:
+    return False
+
+
+def _cmd_mode(rest: list[str], env) -> bool:
+    if not rest:
+        try:
+            print(f"mode: {env.get('MODE')}")
+        except Exception:
+            print("mode: unknown")
+        return True
+    m = rest[0].strip().lower()
+    if m not in ("red", "blue", "redteam", "blueteam"):
+        print("Usage: .mode red|blue|redteam|blueteam")
+        return True
+    # Normalize team names
+    if m == "redteam":
+        m = "red"
+    elif m == "blueteam":
+        m = "blue"
+    env.define("MODE", m)
+    # Set team-specific environment
+    if m == "red":
+        _emit(f"[ok] mode set to {m} team",
+              "[red team] Offensive security mode activated",
+              "[red team] Available: attack, exploit, payload, inject, brute")
+    else:
+        _emit(f"[ok] mode set to {m} team",
+              "[blue team] Defensive security mode activated",
+              "[blue team] Available: defend, protect, monitor, quarantine, alert")
+    return True
+
+
+# Evaluation is not thread-safe: the interpreter signals `return`
+# through module-level globals and draws frames from a shared env pool,
+# so the .load worker and the main loop must never evaluate
+# concurrently. Every evaluate call in this module holds this lock;
+# read and parse still overlap the prompt.
+_EVAL_LOCK = threading.Lock()
+
+# .load runs on one background worker so read+parse+eval of a large
+# file doesn't block the prompt. A single worker keeps loads ordered;
+# finished results are printed by _poll_load from the main loop.
+_LOAD_POOL: ThreadPoolExecutor | None = None
+_PENDING_LOAD: list = []
+
+
+def _load_pool() -> ThreadPoolExecutor:
+    global _LOAD_POOL
+    if _LOAD_POOL is None:
+        _LOAD_POOL = ThreadPoolExecutor(max_workers=1)
+        atexit.register(_LOAD_POOL.shutdown)
+    return _LOAD_POOL
+
+
+def _load_and_eval(path: str, mtime_ns: int, size: int, env) -> str:
+    """Worker-side body of .load; returns the text to print."""
+    out: list[str] = []
+    try:
+        source = _read_source(path, mtime_ns, size)
+        program = _parse_cached(source)
+        with _EVAL_LOCK:
+            result = evaluate(program, env)
+        if result is not None:
+            out.append(str(result))
+    except ParseError as pe:
+        out.append(f"Parse error: {pe}")
+    except RuntimeErrorAegis as err:
+        out.append(f"Runtime error: {err}")
+        st = current_stack()
+        if st:
+            out.append("Stack:")
+            out.extend(f"  at {f}()" for f in reversed(st))
+    return "\n".join(out)
+
+
+def _poll_load() -> None:
+    # Print the output of any finished background load, oldest first
+    while _PENDING_LOAD and _PENDING_LOAD[0].done():
+        out = _PENDING_LOAD.pop(0).result()
+        if out:
+            print(out)
+
+
+def _cmd_load(rest: list[str], env) -> bool:
+    if not rest:
+        print("Usage: .load FILE")
+        return True
+    path = rest[0].strip()
+    p = Path(path)
+    if not p.exists():
+        print(f"Not found: {path}")
+        return True
+    st = p.stat()
+    _PENDING_LOAD.append(
+        _load_pool().submit(_load_and_eval, str(p), st.st_mtime_ns, st.st_size, env)
+    )
+    return True
+
+
+def _cmd_show(rest: list[str], env) -> bool:
+    if not rest:
+        print("Usage: .show VARIABLE")
+        return True
+    var_name = rest[0].strip()
+    try:
+        value = env.get(var_name)
+        print(f"{var_name} = {value}")
+    except Exception as e:
+        print(f"Variable '{var_name}' not found: {e}")
+    return True
+
+
+_DOT_CMDS = MappingProxyType({
+    ".help": _cmd_help,
+    ".exit": _cmd_exit,
+    ".mode": _cmd_mode,
+    ".load": _cmd_load,
+    ".show": _cmd_show,
+})
+
+
+def _init_readline(env) -> None:
+    """Enable line editing, persistent history and tab completion.
+
+    readline is stdlib but platform-dependent, so its absence just
+    leaves input() in plain mode.
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+
+    def completer(text, state, _matches=[]):
+        if state == 0:
+            names = set(env.store) | _CYBER_KEYWORDS | set(_DOT_CMDS)
+            _matches[:] = sorted(n for n in names if n.startswith(text))
+        return _matches[state] if state < len(_matches) else None
+
+    readline.set_completer(completer)
+    readline.parse_and_bind("tab: complete")
+    hist = Path.home() / ".aegis" / "history"
+    try:
+        hist.parent.mkdir(parents=True, exist_ok=True)
+        readline.read_history_file(hist)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    atexit.register(_save_history, str(hist))
+
+
+def _save_history(path: str) -> None:
+    try:
+        import readline
+        readline.write_history_file(path)
+    except Exception:
+        pass
+
+
 def start_repl() -> None:
     env = make_global_env()
+    _init_readline(env)
     # default mode if not set
     try:
         env.get("MODE")
     except Exception:
         env.define("MODE", "blue")
     print("Aegis REPL. Ctrl+C to exit. Type .help for help.")
+    if _njit is not None:
+        # warm the compiled scanner so the first input doesn't pay
+        # numba's compile latency
+        _advance_brace_state([0, False, False], '{"x"}')
+    # Pending multiline block. Appends are amortized O(1) and the
+    # source string is materialized exactly once per block, at
+    # submission — never per keystroke line.
     buffer: list[str] = []
+    # incremental brace scanner state: [depth, in_string, escape];
+    # advanced per appended line so a growing block is never rescanned
+    brace_state: list = [0, False, False]
     while True:
+        _poll_load()
         try:
             prompt = ".. " if buffer else ">> "
             line = input(prompt)
@@ -49,134 +270,113 @@ def start_repl() -> None:
         # Handle colon team commands
         if line.strip() == ':redteam':
             env.define("MODE", "red")
-            print("[red team] Offensive security mode activated")
-            print("[red team] Available: attack, exploit, payload, inject, brute")
+            _emit("[red team] Offensive security mode activated",
+                  "[red team] Available: attack, exploit, payload, inject, brute")
             continue
         elif line.strip() == ':blueteam':
-            env.define("MODE", "blue") 
-            print("[blue team] Defensive security mode activated")
-            print("[blue team] Available: defend, protect, monitor, quarantine, alert")
+            env.define("MODE", "blue")
+            _emit("[blue team] Defensive security mode activated",
+                  "[blue team] Available: defend, protect, monitor, quarantine, alert")
             continue
         
-        # commands
+        # commands: one dict lookup; unknown '.' lines fall through to
+        # normal handling like before
         if not buffer and line.startswith("."):
             cmd, *rest = line.strip().split(maxsplit=1)
-            if cmd == ".help":
-                print(HELP)
-                continue
-            if cmd == ".exit":
-                return
-            if cmd == ".mode":
-                if not rest:
-                    try:
-                        print(f"mode: {env.get('MODE')}")
-                    except Exception:
-                        print("mode: unknown")
+            handler = _DOT_CMDS.get(cmd)
+            if handler is not None:
+                if handler(rest, env):
                     continue
-                m = rest[0].strip().lower()
-                if m not in ("red", "blue", "redteam", "blueteam"):
-                    print("Usage: .mode red|blue|redteam|blueteam")
-                    continue
-                # Normalize team names
-                if m == "redteam":
-                    m = "red"
-                elif m == "blueteam":
-                    m = "blue"
-                env.define("MODE", m)
-                print(f"[ok] mode set to {m} team")
-                # Set team-specific environment
-                if m == "red":
-                    print("[red team] Offensive security mode activated")
-                    print("[red team] Available: attack, exploit, payload, inject, brute")
-                else:
-                    print("[blue team] Defensive security mode activated") 
-                    print("[blue team] Available: defend, protect, monitor, quarantine, alert")
-                continue
-            if cmd == ".load":
-                if not rest:
-                    print("Usage: .load FILE")
-                    continue
-                path = rest[0].strip()
-                p = Path(path)
-                if not p.exists():
-                    print(f"Not found: {path}")
-                    continue
-                try:
-                    source = p.read_text(encoding="utf-8")
-                    program = parse(source)
-                    result = evaluate(program, env)
-                    if result is not None:
-                        print(result)
-                except ParseError as pe:
-                    print(f"Parse error: {pe}")
-                except RuntimeErrorAegis as re:
-                    print(f"Runtime error: {re}")
-                    st = current_stack()
-                    if st:
-                        print("Stack:")
-                        for f in reversed(st):
-                            print(f"  at {f}()")
-                continue
-            if cmd == ".show":
-                if not rest:
-                    print("Usage: .show VARIABLE")
-                    continue
-                var_name = rest[0].strip()
-                try:
-                    value = env.get(var_name)
-                    print(f"{var_name} = {value}")
-                except Exception as e:
-                    print(f"Variable '{var_name}' not found: {e}")
-                continue
+                return
         # keyword-mode handling (only when not in a multiline buffer)
         if not buffer and _handle_keyword_line(line, env):
             continue
         # multiline handling
         buffer.append(line)
+        _advance_brace_state(brace_state, line)
         # heuristic: if braces balanced and not ending with unfinished token, run
-        src = "\n".join(buffer)
-        if _balanced_braces(src):
+        if brace_state[0] == 0:
+            src = "\n".join(buffer)
             try:
-                program = parse(src)
-                result = evaluate(program, env)
+                program = _parse_cached(src)
+                with _EVAL_LOCK:
+                    result = evaluate(program, env)
                 if result is not None:
                     print(result)
             except ParseError as pe:
                 print(f"Parse error: {pe}")
             except RuntimeErrorAegis as re:
-                print(f"Runtime error: {re}")
                 st = current_stack()
                 if st:
-                    print("Stack:")
-                    for f in reversed(st):
-                        print(f"  at {f}()")
+                    _emit(f"Runtime error: {re}", "Stack:",
+                          *(f"  at {f}()" for f in reversed(st)))
+                else:
+                    print(f"Runtime error: {re}")
             finally:
                 buffer.clear()
+                brace_state[:] = [0, False, False]
 
 
-def _balanced_braces(s: str) -> bool:
-    count = 0
-    in_string = False
-    escape = False
-    for ch in s:
-        if in_string:
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
+def _advance_brace_state(state: list, line: str) -> None:
+    """Advance [depth, in_string, escape] over one appended line.
+
+    Equivalent to rescanning the joined buffer from scratch, but
+    O(len(line)) per submission instead of O(buffer). The implicit
+    newline between lines only matters when a string escape is pending,
+    which it then consumes.
+    """
+    count, in_string, escape = state
+    if not in_string and '"' not in line and "\\" not in line:
+        # no string machinery involved: count braces at C speed
+        state[0] = count + line.count("{") - line.count("}")
+        return
+    if _njit is not None:
+        # UTF-8 continuation bytes can never collide with the ASCII
+        # codes the kernel tests for, so a byte scan is exact
+        count, in_string, escape = _scan_braces_nb(
+            line.encode("utf-8"), count, in_string, escape)
+    else:
+        for ch in line:
+            if in_string:
+                if escape:
+                    escape = False
+                    continue
+                if ch == "\\":
+                    escape = True
+                    continue
+                if ch == '"':
+                    in_string = False
                 continue
             if ch == '"':
-                in_string = False
-            continue
-        if ch == '"':
-            in_string = True
-            continue
-        if ch == '{':
-            count += 1
-        elif ch == '}':
-            count -= 1
-    return count == 0
+                in_string = True
+                continue
+            if ch == '{':
+                count += 1
+            elif ch == '}':
+                count -= 1
+    if escape:
+        escape = False  # the joining "\n" is consumed by the escape
+    state[0], state[1], state[2] = count, in_string, escape
+
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _scan_braces_nb(buf, count, in_string, escape):  # pragma: no cover
+        for b in buf:
+            if in_string:
+                if escape:
+                    escape = False
+                elif b == 92:     # backslash
+                    escape = True
+                elif b == 34:     # double quote
+                    in_string = False
+            elif b == 34:
+                in_string = True
+            elif b == 123:        # {
+                count += 1
+            elif b == 125:        # }
+                count -= 1
+        return count, in_string, escape
 
 
 
@@ -190,38 +390,37 @@ def _handle_keyword_line(line: str, env) -> bool:
     if s.startswith("~"):
         return True
     # Scan for presence of any cybersecurity keyword anywhere in line
-    lower = s.lower()
-    if not any(f" {kw} " in f" {lower} " for kw in _CYBER_KEYWORDS):
+    if _CYBER_KEYWORD_RE.search(s) is None:
         return False
-    tokens = _freeform_tokenize(s)
+    # One pass tokenizes, lowers, and records which control keywords
+    # occur; the priority checks below are then set probes instead of
+    # repeated O(n) membership scans over the token list.
+    tokens, low_tokens, controls = _scan_freeform(s)
     if not tokens:
         return False
-    # Control-flow handling: if/while/until/when
-    low_tokens = [t.lower() for t in tokens]
-    if "after" in low_tokens:
-        _handle_after(tokens, env)
+    if "after" in controls:
+        _handle_after(tokens, low_tokens, env)
         return True
-    if "if" in low_tokens or "when" in low_tokens:
+    if "if" in controls or "when" in controls:
         # normalize 'when' to 'if' for freeform REPL conditions
-        tokens = ["if" if t.lower() == "when" else t for t in tokens]
-        _handle_if_chain(tokens, env)
+        tokens = ["if" if lt == "when" else t for t, lt in zip(tokens, low_tokens)]
+        low_tokens = ["if" if lt == "when" else lt for lt in low_tokens]
+        _handle_if_chain(tokens, low_tokens, env)
         return True
-    if "while" in low_tokens or "until" in low_tokens:
-        _handle_loop(tokens, env)
+    if "while" in controls or "until" in controls:
+        _handle_loop(tokens, low_tokens, env)
         return True
-    # Split by 'and' for chaining (case-insensitive), preserving quoted groups
-    chains = _split_on_and(tokens)
+    # Split by 'and' for chaining (case-insensitive), preserving quoted
+    # groups. Chains are (lo, hi) index windows into the token lists; a
+    # sublist is materialized only when a handler actually fires.
     handled_any = False
-    for toks in chains:
-        if not toks:
-            continue
-        # Scan entire token list for known keywords; dispatch starting at each occurrence
+    for lo, hi in _iter_and_chains(low_tokens):
+        # Scan the window for known keywords; dispatch starting at each occurrence
         dispatched = False
-        for i, t in enumerate(toks):
-            key = t.lower()
+        for j in range(lo, hi):
+            key = low_tokens[j]
             if key in _KEYWORD_DISPATCH:
-                sub = toks[i:]
-                if _KEYWORD_DISPATCH[key](sub, env):
+                if _KEYWORD_DISPATCH[key](tokens[lo:hi], j - lo, env):
                     handled_any = True
                     dispatched = True
                     break
@@ -231,50 +430,54 @@ def _handle_keyword_line(line: str, env) -> bool:
     return handled_any
 
 
-def _freeform_tokenize(s: str) -> list[str]:
+# One token is a paren, or a maximal run of quoted segments (a lone
+# trailing quote runs to end of line) and plain chars; quotes glue
+# adjacent segments into one token exactly like the old char loop did.
+_FREEFORM_TOKEN_RE = re.compile(r'[()]|(?:"[^"]*"?|[^\s()"])+')
+
+# Keywords that route a freeform line to a control-flow handler
+_CONTROL_KEYWORDS = frozenset({"after", "if", "when", "while", "until"})
+
+
+def _scan_freeform(s: str) -> tuple[list[str], list[str], set]:
+    """Tokenize a freeform line in one pass.
+
+    Returns the tokens, their lowered twins, and the set of control
+    keywords seen, so the caller never re-walks the token list.
+    """
     tokens: list[str] = []
-    cur: list[str] = []
-    in_quotes = False
-    i = 0
-    while i < len(s):
-        ch = s[i]
-        if ch == '"':
-            in_quotes = not in_quotes
-            i += 1
-            continue
-        if not in_quotes and ch in "()":
-            if cur:
-                tokens.append("".join(cur))
-                cur = []
-            tokens.append(ch)
-            i += 1
-            continue
-        if not in_quotes and ch.isspace():
-            if cur:
-                tokens.append("".join(cur))
-                cur = []
-            i += 1
-            continue
-        cur.append(ch)
-        i += 1
-    if cur:
-        tokens.append("".join(cur))
-    return tokens
-
-
-def _split_on_and(tokens: list[str]) -> list[list[str]]:
-    parts: list[list[str]] = []
-    cur: list[str] = []
-    for t in tokens:
-        if t.lower() == "and":
-            if cur:
-                parts.append(cur)
-                cur = []
-            continue
-        cur.append(t)
-    if cur:
-        parts.append(cur)
-    return parts
+    low_tokens: list[str] = []
+    controls: set = set()
+    append = tokens.append
+    low_append = low_tokens.append
+    for m in _FREEFORM_TOKEN_RE.finditer(s):
+        t = m.group()
+        if '"' in t:
+            t = t.replace('"', "")
+            if not t:
+                continue  # a bare "" contributed nothing before either
+        append(t)
+        lt = t.lower()
+        low_append(lt)
+        if lt in _CONTROL_KEYWORDS:
+            controls.add(lt)
+    return tokens, low_tokens, controls
+
+
+def _iter_and_chains(low_tokens: list[str]):
+    """Yield (lo, hi) windows between 'and' separators, skipping empties.
+
+    Takes pre-lowered tokens and yields index pairs instead of building
+    a list of sublists; callers slice only when they need a real list.
+    """
+    start = 0
+    for i, t in enumerate(low_tokens):
+        if t == "and":
+            if i > start:
+                yield start, i
+            start = i + 1
+    if start < len(low_tokens):
+        yield start, len(low_tokens)
 
 
 def _eval_condition(words: list[str], env) -> bool:
@@ -286,62 +489,52 @@ def _eval_condition(words: list[str], env) -> bool:
 
 def _eval_condition_expr(words: list[str], env) -> bool:
     # parse tokens into a boolean expression with precedence and parentheses
-    toks = _tokenize_condition(words)
-    idx = {"i": 0}
+    v, _ = _cond_or(_tokenize_condition(words), 0, env)
+    return bool(v)
+
+
+# The grammar levels are module-level functions threading (tokens,
+# index) explicitly and returning (value, next index): local-variable
+# index arithmetic instead of the closures over a shared mutable dict
+# this used to allocate per call.
+
+def _cond_primary(toks: list[str], i: int, env):
+    if i >= len(toks):
+        return False, i
+    t = toks[i]
+    if t == "(":
+        v, i = _cond_or(toks, i + 1, env)
+        if i < len(toks) and toks[i] == ")":
+            i += 1
+        return v, i
+    if t == "not":
+        v, i = _cond_primary(toks, i + 1, env)
+        return (not v), i
+    # identifiers / status checks / literals
+    return _eval_atom(t, env), i + 1
+
+
+def _cond_and(toks: list[str], i: int, env):
+    v, i = _cond_primary(toks, i, env)
+    while i < len(toks):
+        t = toks[i]
+        if t == "and":
+            rhs, i = _cond_primary(toks, i + 1, env)
+            v = v and rhs
+        elif t == "nor":
+            rhs, i = _cond_primary(toks, i + 1, env)
+            v = not (v or rhs)
+        else:
+            break
+    return v, i
 
-    def peek():
-        return toks[idx["i"]] if idx["i"] < len(toks) else None
 
-    def consume():
-        t = peek()
-        idx["i"] += 1
-        return t
-
-    def parse_primary():
-        t = peek()
-        if t is None:
-            return False
-        if t == "(":
-            consume()
-            v = parse_or()
-            if peek() == ")":
-                consume()
-            return v
-        if t == "not":
-            consume()
-            return not parse_primary()
-        # identifiers / status checks / literals
-        return _eval_atom(consume(), env)
-
-    def parse_and():
-        v = parse_primary()
-        while True:
-            t = peek()
-            if t == "and":
-                consume()
-                rhs = parse_primary()
-                v = v and rhs
-            elif t == "nor":
-                consume()
-                rhs = parse_primary()
-                v = not (v or rhs)
-            else:
-                break
-        return v
-
-    def parse_or():
-        v = parse_and()
-        while True:
-            t = peek()
-            if t == "or":
-                consume()
-                rhs = parse_and()
-                v = v or rhs
-            else:
-                break
-        return v
-
-    return bool(parse_or())
+def _cond_or(toks: list[str], i: int, env):
+    v, i = _cond_and(toks, i, env)
+    while i < len(toks) and toks[i] == "or":
+        rhs, i = _cond_and(toks, i + 1, env)
+        v = v or rhs
+    return v, i
 
 
 def _tokenize_condition(words: list[str]) -> list[str]:
@@ -389,53 +582,60 @@ def _eval_atom(atom: str, env) -> bool:
     return atom in _CYBER_KEYWORDS
 
 
-def _handle_if_chain(tokens: list[str], env) -> None:
+def _keyword_positions(ws: list[str]) -> dict[str, list[int]]:
+    """Map each lowered token to its (ascending) positions in one pass."""
+    positions: dict[str, list[int]] = {}
+    for j, w in enumerate(ws):
+        positions.setdefault(w, []).append(j)
+    return positions
+
+
+def _first_from(positions: dict[str, list[int]], kw: str, lo: int) -> int:
+    """First position of kw at index >= lo, or -1."""
+    return next((p for p in positions.get(kw, ()) if p >= lo), -1)
+
+
+def _handle_if_chain(tokens: list[str], ws: list[str], env) -> None:
     # Supports: if <cond> then <actions> [unless <guard>] [however <cond2> then <actions2>] [yet|else <else-actions>]
-    ws = [t.lower() for t in tokens]
-    try:
-        if_idx = ws.index("if")
-    except ValueError:
+    # ws is tokens pre-lowered by the caller. One pass builds the
+    # keyword position map; the chain walk reads absolute indices from
+    # it instead of re-scanning shrinking tail slices.
+    positions = _keyword_positions(ws)
+    if "if" not in positions:
         return
-    # find then or block splitters
-    try:
-        then_idx = ws.index("then", if_idx + 1)
-    except ValueError:
+    if_idx = positions["if"][0]
+    then_idx = _first_from(positions, "then", if_idx + 1)
+    if then_idx < 0:
         # if cond {actions} style not supported here; prompt
         print("if: expected 'then' with actions in REPL freeform mode")
         return
     cond_words = tokens[if_idx+1:then_idx]
-    rest = tokens[then_idx+1:]
     # handle optional guard: ... unless <guard>
     guard_words: list[str] | None = None
-    out_actions = rest
-    if "unless" in [r.lower() for r in rest]:
-        rlow = [r.lower() for r in rest]
-        u = rlow.index("unless")
-        out_actions = rest[:u]
-        guard_words = rest[u+1:]
-    # handle however chains
-    branches = [(cond_words, out_actions)]
-    tail = rest
+    u = _first_from(positions, "unless", then_idx + 1)
+    if u >= 0:
+        out_actions = tokens[then_idx+1:u]
+        guard_words = tokens[u+1:]
+    else:
+        out_actions = tokens[then_idx+1:]
     # however cond then actions (can repeat)
+    branches = [(cond_words, out_actions)]
+    base = then_idx + 1
     while True:
-        rlow = [r.lower() for r in tail]
-        if "however" in rlow and "then" in rlow:
-            h = rlow.index("however")
-            try:
-                t = rlow.index("then", h+1)
-            except ValueError:
-                break
-            branches.append((tail[h+1:t], tail[t+1:]))
-            tail = tail[t+1:]
-            continue
-        break
+        h = _first_from(positions, "however", base)
+        if h < 0:
+            break
+        t = _first_from(positions, "then", h + 1)
+        if t < 0:
+            break
+        branches.append((tokens[h+1:t], tokens[t+1:]))
+        base = t + 1
     # optional else/yet/otherwise
     else_actions: list[str] | None = None
-    rlow = [r.lower() for r in tail]
     for kw in ("otherwise", "yet", "else"):
-        if kw in rlow:
-            k = rlow.index(kw)
-            else_actions = tail[k+1:]
+        k = _first_from(positions, kw, base)
+        if k >= 0:
+            else_actions = tokens[k+1:]
             break
     # Evaluate in order
     executed = False
@@ -452,25 +652,22 @@ def _handle_if_chain(tokens: list[str], env) -> None:
         _execute_actions(else_actions, env)
 
 
-def _handle_loop(tokens: list[str], env) -> None:
-    ws = [t.lower() for t in tokens]
+def _handle_loop(tokens: list[str], ws: list[str], env) -> None:
+    # ws is tokens pre-lowered by the caller; one position map replaces
+    # the per-keyword index scans over slices
+    positions = _keyword_positions(ws)
     limit = 10  # safety cap
-    if "while" in ws:
-        i = ws.index("while")
-        # expect: while <cond> do <actions>
-        if "do" in ws[i+1:]:
-            d = ws.index("do", i+1)
-            cond = tokens[i+1:d]
-            actions = tokens[d+1:]
-        else:
-            # fallback to then
-            if "then" in ws[i+1:]:
-                d = ws.index("then", i+1)
-                cond = tokens[i+1:d]
-                actions = tokens[d+1:]
-            else:
+    if "while" in positions:
+        i = positions["while"][0]
+        # expect: while <cond> do <actions>, falling back to then
+        d = _first_from(positions, "do", i + 1)
+        if d < 0:
+            d = _first_from(positions, "then", i + 1)
+            if d < 0:
                 print("while: expected 'do' or 'then'")
                 return
+        cond = tokens[i+1:d]
+        actions = tokens[d+1:]
         count = 0
         while _eval_condition(cond, env):
             _execute_actions(actions, env)
@@ -479,21 +676,17 @@ def _handle_loop(tokens: list[str], env) -> None:
                 print("[warn] while: iteration limit reached")
                 break
         return
-    if "until" in ws:
-        i = ws.index("until")
+    if "until" in positions:
+        i = positions["until"][0]
         # until <cond> do <actions>
-        if "do" in ws[i+1:]:
-            d = ws.index("do", i+1)
-            cond = tokens[i+1:d]
-            actions = tokens[d+1:]
-        else:
-            if "then" in ws[i+1:]:
-                d = ws.index("then", i+1)
-                cond = tokens[i+1:d]
-                actions = tokens[d+1:]
-            else:
+        d = _first_from(positions, "do", i + 1)
+        if d < 0:
+            d = _first_from(positions, "then", i + 1)
+            if d < 0:
                 print("until: expected 'do' or 'then'")
                 return
+        cond = tokens[i+1:d]
+        actions = tokens[d+1:]
         count = 0
         while not _eval_condition(cond, env):
             _execute_actions(actions, env)
@@ -503,13 +696,13 @@ def _handle_loop(tokens: list[str], env) -> None:
                 break
 
 
-def _handle_after(tokens: list[str], env) -> None:
+def _handle_after(tokens: list[str], ws: list[str], env) -> None:
     # after <number> (ms|s|seconds|millis) then <actions>
-    ws = [t.lower() for t in tokens]
-    try:
-        i = ws.index("after")
-    except ValueError:
+    # ws is tokens pre-lowered by the caller
+    positions = _keyword_positions(ws)
+    if "after" not in positions:
         return
+    i = positions["after"][0]
     # find numeric value
     delay_ms = 0
     val = None
@@ -534,43 +727,45 @@ def _handle_after(tokens: list[str], env) -> None:
             val = 0
     delay_ms = val if unit == "ms" else int(val * 1000)
     # find actions after 'then' or end
-    if "then" in ws:
-        t = ws.index("then")
-        actions = tokens[t+1:]
+    if "then" in positions:
+        actions = tokens[positions["then"][0] + 1:]
     else:
         actions = tokens[j+1:]
-    time_mod = env.get("time")
+    time_mod = _get_mod(env, "time")
     _call_native(time_mod, "sleep_ms", [delay_ms])
     _execute_actions(actions, env)
 
 
 def _execute_actions(tokens: list[str], env) -> None:
     # execute chained actions separated by 'and'
-    for chain in _split_on_and(tokens):
-        for i, t in enumerate(chain):
-            key = t.lower()
+    low = [t.lower() for t in tokens]
+    for lo, hi in _iter_and_chains(low):
+        for j in range(lo, hi):
+            key = low[j]
             if key in _KEYWORD_DISPATCH:
-                if _KEYWORD_DISPATCH[key](chain[i:], env):
+                if _KEYWORD_DISPATCH[key](tokens[lo:hi], j - lo, env):
                     break
 
-def _handle_generate(tokens: list[str], env) -> bool:
-    # tokens start with 'generate'
-    if len(tokens) == 1:
+def _handle_generate(tokens: list[str], start: int, env) -> bool:
+    # tokens[start] is 'generate'
+    if len(tokens) - start == 1:
         # ask what to generate
         kind = _prompt("What would you like to generate? (table/payload)")
         if not kind:
             return True
-        tokens = ["generate", kind] + []
-    sub = tokens[1].lower() if len(tokens) >= 2 else ""
+        tokens = ["generate", kind]
+        start = 0
+    sub = tokens[start + 1].lower() if len(tokens) - start >= 2 else ""
     if sub == "table":
-        _action_generate_table(env, tokens[2:])
+        _action_generate_table(env, tokens[start + 2:])
         return True
     if sub == "payload":
         # parse pattern: payload for <platform> [version words...]
         platform = None
         version = None
-        if "for" in [t.lower() for t in tokens[2:]]:
-            idx = [t.lower() for t in tokens].index("for")
+        idx = next((j for j in range(start + 2, len(tokens))
+                    if tokens[j].lower() == "for"), -1)
+        if idx >= 0:
             if idx + 1 < len(tokens):
                 platform = tokens[idx + 1]
                 if idx + 2 < len(tokens):
@@ -586,69 +781,56 @@ def _handle_generate(tokens: list[str], env) -> bool:
     return True
 
 
+# Rainbow-table password list with its encoded twin; md5 consumes
+# bytes, so encoding once at import time keeps the hash loop free of
+# per-entry str.encode calls. A sha256 variant would get SHA-NI
+# acceleration for free through hashlib against OpenSSL 3+.
+_COMMON_PASSWORDS = [
+    "password", "123456", "admin", "root", "guest", "user", "test",
+    "12345", "qwerty", "abc123", "password123", "admin123", "root123",
+    "letmein", "welcome", "monkey", "dragon", "master", "hello",
+    "login", "pass", "1234", "123456789", "12345678", "1234567"
+]
+_PW_BYTES = [p.encode() for p in _COMMON_PASSWORDS]
+
+
 def _action_generate_table(env, args: list[str]) -> None:
-    import hashlib
-    import os
-    from pathlib import Path
-    
     # Create cache directory
     cache_dir = Path.home() / ".aegis" / "cache" / "rainbow_tables"
     cache_dir.mkdir(parents=True, exist_ok=True)
-    
+
     # Generate actual rainbow table
     table_name = f"rainbow_table_{hashlib.md5(str(os.urandom(8)).encode()).hexdigest()[:8]}.txt"
     table_path = cache_dir / table_name
-    
-    # Create rainbow table with common passwords
-    common_passwords = [
-        "password", "123456", "admin", "root", "guest", "user", "test",
-        "12345", "qwerty", "abc123", "password123", "admin123", "root123",
-        "letmein", "welcome", "monkey", "dragon", "master", "hello",
-        "login", "pass", "1234", "123456789", "12345678", "1234567"
-    ]
-    
-    with open(table_path, 'w') as f:
-        f.write("# Rainbow Table Generated by Aegis\n")
-        f.write(f"# Generated: {os.popen('date').read().strip()}\n")
-        f.write("# Hash Algorithm: MD5\n\n")
-        
-        for password in common_passwords:
-            hash_value = hashlib.md5(password.encode()).hexdigest()
-            f.write(f"{hash_value}:{password}\n")
-    
+
+    # Assemble the whole table in one bytes buffer, one write at the end
+    out = bytearray()
+    out += b"# Rainbow Table Generated by Aegis\n"
+    out += time.strftime("# Generated: %Y-%m-%d %H:%M:%S\n").encode()
+    out += b"# Hash Algorithm: MD5\n\n"
+    for pw_b in _PW_BYTES:
+        out += hashlib.md5(pw_b).hexdigest().encode()
+        out += b":"
+        out += pw_b
+        out += b"\n"
+    with open(table_path, 'wb') as f:
+        f.write(bytes(out))
+
     # Store table info
     table_info = {
         "type": "rainbow_table",
         "path": str(table_path),
-        "size": len(common_passwords),
+        "size": len(_COMMON_PASSWORDS),
         "algorithm": "MD5",
-        "entries": common_passwords
+        "entries": list(_COMMON_PASSWORDS)
     }
-    
+
     env.define("LAST_GENERATED", table_info)
-    print(f"[ok] Generated rainbow table with {len(common_passwords)} entries")
-    print(f"[ok] Saved to: {table_path}")
+    _emit(f"[ok] Generated rainbow table with {len(_COMMON_PASSWORDS)} entries",
+          f"[ok] Saved to: {table_path}")
 
 
-def _action_generate_payload(env, platform: str, version: str) -> None:
-    import os
-    import hashlib
-    from pathlib import Path
-    
-    # Create cache directory
-    cache_dir = Path.home() / ".aegis" / "cache" / "payloads"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate actual payload
-    payload_name = f"payload_{platform}_{version}_{hashlib.md5(str(os.urandom(8)).encode()).hexdigest()[:8]}.aeg"
-    payload_path = cache_dir / payload_name
-    
-    # Create platform-specific payload
-    import datetime
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    if platform.lower() in ["android", "andriod"]:
-        payload_code = f'''~ Android {version} Payload Generated by Aegis
+_PAYLOAD_TPL_ANDROID = '''~ Android {version} Payload Generated by Aegis
 ~ Target: {platform} {version}
 ~ Generated: {timestamp}
 
@@ -667,8 +849,8 @@ def android_payload() {{
 ~ Execute payload
 android_payload()
 '''
-    elif platform.lower() in ["windows", "win"]:
-        payload_code = f'''~ Windows {version} Payload Generated by Aegis
+
+_PAYLOAD_TPL_WINDOWS = '''~ Windows {version} Payload Generated by Aegis
 ~ Target: {platform} {version}
 ~ Generated: {timestamp}
 
@@ -687,8 +869,8 @@ def windows_payload() {{
 ~ Execute payload
 windows_payload()
 '''
-    else:
-        payload_code = f'''~ {platform} {version} Payload Generated by Aegis
+
+_PAYLOAD_TPL_GENERIC = '''~ {platform} {version} Payload Generated by Aegis
 ~ Target: {platform} {version}
 ~ Generated: {timestamp}
 
@@ -707,7 +889,31 @@ def generic_payload() {{
 ~ Execute payload
 generic_payload()
 '''
-    
+
+# Lowercased platform name -> template (including the historical
+# 'andriod' spelling); anything else gets the generic payload
+_PAYLOAD_TPLS = {
+    "android": _PAYLOAD_TPL_ANDROID,
+    "andriod": _PAYLOAD_TPL_ANDROID,
+    "windows": _PAYLOAD_TPL_WINDOWS,
+    "win": _PAYLOAD_TPL_WINDOWS,
+}
+
+
+def _action_generate_payload(env, platform: str, version: str) -> None:
+    # Create cache directory
+    cache_dir = Path.home() / ".aegis" / "cache" / "payloads"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Generate actual payload
+    payload_name = f"payload_{platform}_{version}_{hashlib.md5(str(os.urandom(8)).encode()).hexdigest()[:8]}.aeg"
+    payload_path = cache_dir / payload_name
+
+    # Fill the platform template
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    tpl = _PAYLOAD_TPLS.get(platform.lower(), _PAYLOAD_TPL_GENERIC)
+    payload_code = tpl.format(platform=platform, version=version, timestamp=timestamp)
+
     # Write payload to file
     with open(payload_path, 'w') as f:
         f.write(payload_code)
@@ -724,9 +930,9 @@ generic_payload()
     
     env.define("LAST_GENERATED", payload_info)
     pretty = platform + (" " + version if version else "")
-    print(f"[ok] Generated {pretty} payload")
-    print(f"[ok] Saved to: {payload_path}")
-    print(f"[ok] Payload size: {len(payload_code)} characters")
+    _emit(f"[ok] Generated {pretty} payload",
+          f"[ok] Saved to: {payload_path}",
+          f"[ok] Payload size: {len(payload_code)} characters")
 
 
 def _prompt(message: str) -> str:
@@ -746,14 +952,37 @@ _KEYWORD_DISPATCH = {
 # ---------------- Additional cybersecurity keyword handlers ----------------
 
 def _ensure_sec(env):
-    try:
-        sec = env.get("SECURITY")
-    except Exception:
-        sec = {"tunnel": False, "firewall": True, "keylogger": False}
-        env.define("SECURITY", sec)
+    # The status dict is mutated in place and never rebound, so after
+    # the first resolution a getattr replaces the env walk + try/except
+    sec = getattr(env, "_sec_cache", None)
+    if sec is None:
+        try:
+            sec = env.get("SECURITY")
+        except Exception:
+            sec = {"tunnel": False, "firewall": True, "keylogger": False}
+            env.define("SECURITY", sec)
+        env._sec_cache = sec
     return sec
 
 
+def _get_mod(env, name: str):
+    """Resolve a stdlib module binding through env once, then reuse.
+
+    Module handles ('time', 'crypto', 'encoding', ...) are defined by
+    make_global_env and never rebound, so the resolved handle is cached
+    on the environment itself and dies with it.
+    """
+    cache = getattr(env, "_repl_mod_cache", None)
+    if cache is None:
+        cache = {}
+        env._repl_mod_cache = cache
+    mod = cache.get(name)
+    if mod is None:
+        mod = env.get(name)
+        cache[name] = mod
+    return mod
+
+
 def _record_action(env, action: str, detail: str = "") -> None:
     try:
         actions = env.get("LAST_ACTIONS")
@@ -770,10 +999,10 @@ def _call_native(mod, name: str, args: list):
     return fn(args)
 
 
-def _handle_firewall(tokens: list[str], env) -> bool:
+def _handle_firewall(tokens: list[str], start: int, env) -> bool:
     sec = _ensure_sec(env)
     # detect desired state in tokens
-    words = [t.lower() for t in tokens]
+    words = [t.lower() for t in islice(tokens, start, None)]
     if "down" in words or "disable" in words or "deactivate" in words:
         sec["firewall"] = False
         print("[ok] Firewall set to down (stub)")
@@ -787,9 +1016,9 @@ def _handle_firewall(tokens: list[str], env) -> bool:
     return True
 
 
-def _handle_tunnel(tokens: list[str], env) -> bool:
+def _handle_tunnel(tokens: list[str], start: int, env) -> bool:
     sec = _ensure_sec(env)
-    words = [t.lower() for t in tokens]
+    words = [t.lower() for t in islice(tokens, start, None)]
     if "active" in words or "up" in words or "on" in words or "activate" in words:
         sec["tunnel"] = True
         print("[ok] Tunnel set to active (stub)")
@@ -803,57 +1032,57 @@ def _handle_tunnel(tokens: list[str], env) -> bool:
     return True
 
 
-def _handle_keylogger(tokens: list[str], env) -> bool:
+def _handle_keylogger(tokens: list[str], start: int, env) -> bool:
     sec = _ensure_sec(env)
     # detection is a stub: set flag if words contain detected
-    detected = any(t.lower() in {"detected", "present", "found"} for t in tokens)
+    detected = any(t.lower() in {"detected", "present", "found"} for t in islice(tokens, start, None))
     sec["keylogger"] = detected
     print(f"[ok] Keylogger status: {'detected' if detected else 'not detected'} (stub)")
     _record_action(env, "keylogger", "status")
     return True
 
 
-def _handle_hash(tokens: list[str], env) -> bool:
-    text = " ".join(tokens[1:]) if len(tokens) > 1 else ""
+def _handle_hash(tokens: list[str], start: int, env) -> bool:
+    text = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else ""
     if not text:
         text = _prompt("Text to hash?")
     if not text:
         return True
-    crypto = env.get("crypto")
+    crypto = _get_mod(env, "crypto")
     digest = _call_native(crypto, "sha256", [text])
     print(digest)
     _record_action(env, "hash", text)
     return True
 
 
-def _handle_encrypt(tokens: list[str], env) -> bool:
-    text = " ".join(tokens[1:]) if len(tokens) > 1 else ""
+def _handle_encrypt(tokens: list[str], start: int, env) -> bool:
+    text = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else ""
     if not text:
         text = _prompt("Text to encode (base64 stub)?")
     if not text:
         return True
-    encoding = env.get("encoding")
+    encoding = _get_mod(env, "encoding")
     out = _call_native(encoding, "base64_encode", [text])
     print(out)
     _record_action(env, "encrypt", "base64")
     return True
 
 
-def _handle_decrypt(tokens: list[str], env) -> bool:
-    text = " ".join(tokens[1:]) if len(tokens) > 1 else ""
+def _handle_decrypt(tokens: list[str], start: int, env) -> bool:
+    text = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else ""
     if not text:
         text = _prompt("Base64 to decode?")
     if not text:
         return True
-    encoding = env.get("encoding")
+    encoding = _get_mod(env, "encoding")
     out = _call_native(encoding, "base64_decode", [text])
     print(out)
     _record_action(env, "decrypt", "base64")
     return True
 
 
-def _handle_inject(tokens: list[str], env) -> bool:
-    target = " ".join(tokens[1:]) if len(tokens) > 1 else ""
+def _handle_inject(tokens: list[str], start: int, env) -> bool:
+    target = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else ""
     if not target:
         target = _prompt("Inject into what target?")
     
@@ -868,12 +1097,12 @@ def _handle_inject(tokens: list[str], env) -> bool:
                 try:
                     with open(payload_path, 'r') as f:
                         payload_code = f.read()
-                    
-                    # Parse and execute the payload
-                    from .parser import parse
-                    from .interpreter import evaluate
+
+                    # Parse and execute the payload (parse/evaluate are
+                    # the module-level bindings)
                     program = parse(payload_code)
-                    result = evaluate(program, env)
+                    with _EVAL_LOCK:
+                        result = evaluate(program, env)
                     
                     print(f"[ok] Payload executed successfully on {target}")
                     if result:
@@ -891,27 +1120,27 @@ def _handle_inject(tokens: list[str], env) -> bool:
     return True
 
 
-def _handle_attack(tokens: list[str], env) -> bool:
+def _handle_attack(tokens: list[str], start: int, env) -> bool:
     print("[ok] Attack action queued (stub)")
     _record_action(env, "attack")
     return True
 
 
-def _handle_defend(tokens: list[str], env) -> bool:
+def _handle_defend(tokens: list[str], start: int, env) -> bool:
     print("[ok] Defend action engaged (stub)")
     _record_action(env, "defend")
     return True
 
 
-def _handle_activate(tokens: list[str], env) -> bool:
+def _handle_activate(tokens: list[str], start: int, env) -> bool:
     print("[ok] Activated (stub)")
-    _record_action(env, "activate", " ".join(tokens[1:]))
+    _record_action(env, "activate", " ".join(tokens[start + 1:]))
     return True
 
 
-def _handle_deactivate(tokens: list[str], env) -> bool:
+def _handle_deactivate(tokens: list[str], start: int, env) -> bool:
     print("[ok] Deactivated (stub)")
-    _record_action(env, "deactivate", " ".join(tokens[1:]))
+    _record_action(env, "deactivate", " ".join(tokens[start + 1:]))
     return True
 
 
@@ -924,9 +1153,9 @@ def _ensure_store(env):
     return store
 
 
-def _handle_read(tokens: list[str], env) -> bool:
+def _handle_read(tokens: list[str], start: int, env) -> bool:
     store = _ensure_store(env)
-    key = tokens[1] if len(tokens) > 1 else _prompt("Key to read?")
+    key = tokens[start + 1] if len(tokens) > start + 1 else _prompt("Key to read?")
     if not key:
         return True
     print(store.get(key))
@@ -934,70 +1163,71 @@ def _handle_read(tokens: list[str], env) -> bool:
     return True
 
 
-def _handle_write(tokens: list[str], env) -> bool:
+def _handle_write(tokens: list[str], start: int, env) -> bool:
     store = _ensure_store(env)
-    key = tokens[1] if len(tokens) > 1 else _prompt("Key to write?")
+    key = tokens[start + 1] if len(tokens) > start + 1 else _prompt("Key to write?")
     if not key:
         return True
-    value = " ".join(tokens[2:]) if len(tokens) > 2 else _prompt("Value?")
+    value = " ".join(tokens[start + 2:]) if len(tokens) > start + 2 else _prompt("Value?")
     store[key] = value
     print("[ok] written")
     _record_action(env, "write", key)
     return True
 
 
-def _handle_save(tokens: list[str], env) -> bool:
-    return _handle_write(tokens, env)
+def _handle_save(tokens: list[str], start: int, env) -> bool:
+    return _handle_write(tokens, start, env)
 
 
-def _handle_load(tokens: list[str], env) -> bool:
-    return _handle_read(tokens, env)
+def _handle_load(tokens: list[str], start: int, env) -> bool:
+    return _handle_read(tokens, start, env)
 
 
-def _handle_analyze(tokens: list[str], env) -> bool:
-    text = " ".join(tokens[1:]) if len(tokens) > 1 else _prompt("What to analyze?")
+def _handle_analyze(tokens: list[str], start: int, env) -> bool:
+    text = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else _prompt("What to analyze?")
     print(f"[ok] Analyzed (stub): {text}")
     _record_action(env, "analyze", text)
     return True
 
 
-def _handle_protect(tokens: list[str], env) -> bool:
+def _handle_protect(tokens: list[str], start: int, env) -> bool:
     print("[ok] Protection enabled (stub)")
     _record_action(env, "protect")
     return True
 
 
-def _handle_override(tokens: list[str], env) -> bool:
+def _handle_override(tokens: list[str], start: int, env) -> bool:
     print("[ok] Override issued (stub)")
     _record_action(env, "override")
     return True
 
 
-def _handle_contain(tokens: list[str], env) -> bool:
+def _handle_contain(tokens: list[str], start: int, env) -> bool:
     print("[ok] Incident contained (stub)")
     _record_action(env, "contain")
     return True
 
 
-def _handle_payload(tokens: list[str], env) -> bool:
+def _handle_payload(tokens: list[str], start: int, env) -> bool:
     # Direct payload generation - no "generate" prefix needed
-    if len(tokens) == 1:
+    if len(tokens) - start == 1:
         # Just "payload" - ask for platform
         platform = _prompt("Target platform for payload (e.g., android, ios, windows)?") or "unspecified"
         version = _prompt("Any version or variant? (press Enter to skip)") or ""
         _action_generate_payload(env, platform, version)
         return True
-    
+
     # Parse: payload for <platform> [version]
     platform = None
     version = None
-    if "for" in [t.lower() for t in tokens[1:]]:
-        idx = [t.lower() for t in tokens].index("for")
+    idx = next((j for j in range(start + 1, len(tokens))
+                if tokens[j].lower() == "for"), -1)
+    if idx >= 0:
         if idx + 1 < len(tokens):
             platform = tokens[idx + 1]
             if idx + 2 < len(tokens):
                 version = " ".join(tokens[idx + 2:])
-    
+
     if not platform:
         platform = _prompt("Target platform for payload (e.g., android, ios, windows)?") or "unspecified"
     if version is None:
@@ -1007,68 +1237,68 @@ def _handle_payload(tokens: list[str], env) -> bool:
     return True
 
 
-def _handle_table(tokens: list[str], env) -> bool:
-    return _handle_generate(["generate", "table"] + tokens[1:], env)
+def _handle_table(tokens: list[str], start: int, env) -> bool:
+    return _handle_generate(["generate", "table"] + tokens[start + 1:], 0, env)
 
 
-def _handle_brute(tokens: list[str], env) -> bool:
+def _handle_brute(tokens: list[str], start: int, env) -> bool:
     print("[ok] Brute action stubbed (no real brute-force)")
     _record_action(env, "brute")
     return True
 
 
-def _handle_break(tokens: list[str], env) -> bool:
+def _handle_break(tokens: list[str], start: int, env) -> bool:
     print("[ok] Breakpoint reached (stub)")
     _record_action(env, "break")
     return True
 
 
-def _handle_pause(tokens: list[str], env) -> bool:
-    dur = tokens[1] if len(tokens) > 1 else _prompt("Pause milliseconds?")
+def _handle_pause(tokens: list[str], start: int, env) -> bool:
+    dur = tokens[start + 1] if len(tokens) > start + 1 else _prompt("Pause milliseconds?")
     try:
         ms = int(dur)
     except Exception:
         ms = 250
-    time_mod = env.get("time")
+    time_mod = _get_mod(env, "time")
     _call_native(time_mod, "sleep_ms", [ms])
     print(f"[ok] Paused {ms}ms")
     _record_action(env, "pause", str(ms))
     return True
 
 
-def _handle_enter(tokens: list[str], env) -> bool:
+def _handle_enter(tokens: list[str], start: int, env) -> bool:
     print("[ok] Enter scope (stub)")
     _record_action(env, "enter")
     return True
 
 
-def _handle_exit(tokens: list[str], env) -> bool:
+def _handle_exit(tokens: list[str], start: int, env) -> bool:
     print("[ok] Exit scope (stub) — use .exit to leave REPL")
     _record_action(env, "exit")
     return True
 
 
-def _handle_corrupt(tokens: list[str], env) -> bool:
+def _handle_corrupt(tokens: list[str], start: int, env) -> bool:
     print("[ok] Corrupt action ignored (stub)")
     _record_action(env, "corrupt")
     return True
 
 
-def _handle_manipulate(tokens: list[str], env) -> bool:
+def _handle_manipulate(tokens: list[str], start: int, env) -> bool:
     print("[ok] Manipulate action stub")
     _record_action(env, "manipulate")
     return True
 
 
-def _handle_trace(tokens: list[str], env) -> bool:
-    target = " ".join(tokens[1:]) if len(tokens) > 1 else "system"
+def _handle_trace(tokens: list[str], start: int, env) -> bool:
+    target = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else "system"
     print(f"[ok] Tracing {target} (stub)")
     _record_action(env, "trace", target)
     return True
 
 
-def _handle_monitor(tokens: list[str], env) -> bool:
-    target = " ".join(tokens[1:]) if len(tokens) > 1 else "system"
+def _handle_monitor(tokens: list[str], start: int, env) -> bool:
+    target = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else "system"
     # Use the real monitor function if available
     try:
         monitor_func = env.get("monitor")
@@ -1086,15 +1316,15 @@ def _handle_monitor(tokens: list[str], env) -> bool:
     return True
 
 
-def _handle_quarantine(tokens: list[str], env) -> bool:
-    target = " ".join(tokens[1:]) if len(tokens) > 1 else "threat"
+def _handle_quarantine(tokens: list[str], start: int, env) -> bool:
+    target = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else "threat"
     print(f"[ok] Quarantined {target} (stub)")
     _record_action(env, "quarantine", target)
     return True
 
 
-def _handle_alert(tokens: list[str], env) -> bool:
-    message = " ".join(tokens[1:]) if len(tokens) > 1 else "Security alert"
+def _handle_alert(tokens: list[str], start: int, env) -> bool:
+    message = " ".join(tokens[start + 1:]) if len(tokens) > start + 1 else "Security alert"
     print(f"[ALERT] {message}")
     _record_action(env, "alert", message)
     return True
@@ -1131,24 +1361,39 @@ _KEYWORD_DISPATCH.update({
     "corrupt": _handle_corrupt,
     "manipulate": _handle_manipulate,
     # flow readability no-ops
-    "before": lambda t,e: True,
-    "since": lambda t,e: True,
-    "because": lambda t,e: True,
+    "before": lambda t,s,e: True,
+    "since": lambda t,s,e: True,
+    "because": lambda t,s,e: True,
     # new executable context keywords
-    "trace": lambda t,e: _handle_trace(t,e),
-    "monitor": lambda t,e: _handle_monitor(t,e),
-    "quarantine": lambda t,e: _handle_quarantine(t,e),
-    "alert": lambda t,e: _handle_alert(t,e),
+    "trace": lambda t,s,e: _handle_trace(t,s,e),
+    "monitor": lambda t,s,e: _handle_monitor(t,s,e),
+    "quarantine": lambda t,s,e: _handle_quarantine(t,s,e),
+    "alert": lambda t,s,e: _handle_alert(t,s,e),
 })
 
+# The table is complete at this point; expose it read-only so the
+# dispatch scans above can rely on it never changing at runtime
+_KEYWORD_DISPATCH = MappingProxyType(_KEYWORD_DISPATCH)
+
 
-# Keyword list for scanning
-_CYBER_KEYWORDS = {
+# Keyword set; the line probe is the compiled regex below, this set
+# only backs O(1) containment checks like _eval_atom's truthy fallback
+_CYBER_KEYWORDS = frozenset({
     "override", "firewall", "tunnel", "keylogger", "generate", "hash", "encrypt", "decrypt",
     "protect", "attack", "defend", "activate", "deactivate", "analyze", "contain", "payload",
     "load", "manipulate", "inject", "read", "write", "save", "corrupt", "break", "pause",
     "enter", "exit", "table", "brute", "trace", "monitor", "quarantine", "alert",
-}
+})
+
+# Single compiled alternation for the per-line keyword probe; one
+# C-level scan instead of len(_CYBER_KEYWORDS) substring searches plus
+# two padded-string allocations. The lookarounds replicate the old
+# space-padded matching: keywords count only when space-delimited (or
+# at either end of the line).
+_CYBER_KEYWORD_RE = re.compile(
+    r"(?<![^ ])(?:" + "|".join(sorted(map(re.escape, _CYBER_KEYWORDS))) + r")(?![^ ])",
+    re.IGNORECASE,
+)
 
 
 # ---------------- Syntax colorization ----------------
@@ -1263,5 +1508,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -1,8 +1,17 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, List, Callable, Tuple
 import json
 
+# Same slots gate as ast_nodes: runtime values are allocated per call
+# or per instantiation, so dropping the per-instance __dict__ pays off
+# (the dataclasses arg exists on 3.10+)
+if sys.version_info >= (3, 10):
+    _dc = dataclass(slots=True)
+else:
+    _dc = dataclass
+
 
 class RuntimeErrorAegis(Exception):
     pass
@@ -34,6 +43,9 @@ class Environment:
     def __init__(self, outer: Optional['Environment'] = None):
         self.store: Dict[str, Any] = {}
         self.outer = outer
+        # Index-keyed parameter slots for slotted function calls; the
+        # interpreter fills this instead of store when it can
+        self.slots: Optional[List[Any]] = None
 
     def define(self, name: str, value: Any) -> None:
         self.store[name] = value
@@ -61,15 +73,29 @@ class Environment:
         self.define(name, value)
 
 
-@dataclass
+@_dc
 class FunctionValue:
     name: Optional[str]
-    params: List[str]
+    params: Tuple[str, ...]
     body: Any  # Block
     env: Environment
-
-
-@dataclass
+    # Lazily computed by the interpreter: whether the body can leak its
+    # call environment (e.g. by defining a closure), and whether
+    # parameters can be bound by integer slot instead of name
+    _escapes: Optional[bool] = field(default=None, repr=False, compare=False)
+    _slotted: Optional[bool] = field(default=None, repr=False, compare=False)
+    # Compiled numeric fast path from jit_compile; None = not yet tried,
+    # False = body not compilable, otherwise a callable taking the args list
+    _jit: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Normalize to a tuple so argument binding can zip straight
+        # into the environment store
+        if not isinstance(self.params, tuple):
+            self.params = tuple(self.params)
+
+
+@_dc
 class NativeFunction:
     name: str
     func: Callable[[List[Any]], Any]
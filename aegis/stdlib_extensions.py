@@ -7,20 +7,27 @@ from __future__ import annotations
 import os
 import sys
 import json
-import csv
-import yaml
-import toml
-import uuid
 import random
 import string
+import stat
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 from .runtime import NativeFunction
 
 
-def make_filesystem() -> Dict[str, Any]:
+# One os.stat answers existence and type together; the predicates
+# below share it instead of building a Path and re-statting per check
+def _stat_or_none(path: Any) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _build_filesystem() -> Dict[str, Any]:
     """Enhanced filesystem operations."""
     
     def read_file(args: List[Any]) -> Any:
@@ -42,26 +49,39 @@ def make_filesystem() -> Dict[str, Any]:
     def list_dir(args: List[Any]) -> Any:
         if not args:
             raise ValueError("list_dir requires a path")
-        path = Path(args[0])
         recursive = args[1] if len(args) > 1 else False
-        if recursive:
-            return [str(p) for p in path.rglob("*") if p.is_file()]
-        return [str(p) for p in path.iterdir()]
+        # scandir gets the entry type from readdir itself, so no
+        # per-entry stat the way iterdir/rglob + is_file() does
+        if not recursive:
+            with os.scandir(args[0]) as entries:
+                return [entry.path for entry in entries]
+        files = []
+        stack = [str(args[0])]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(entry.path)
+        return files
     
     def exists(args: List[Any]) -> Any:
         if not args:
             raise ValueError("exists requires a path")
-        return Path(args[0]).exists()
+        return _stat_or_none(args[0]) is not None
     
     def is_file(args: List[Any]) -> Any:
         if not args:
             raise ValueError("is_file requires a path")
-        return Path(args[0]).is_file()
+        st = _stat_or_none(args[0])
+        return st is not None and stat.S_ISREG(st.st_mode)
     
     def is_dir(args: List[Any]) -> Any:
         if not args:
             raise ValueError("is_dir requires a path")
-        return Path(args[0]).is_dir()
+        st = _stat_or_none(args[0])
+        return st is not None and stat.S_ISDIR(st.st_mode)
     
     def mkdir(args: List[Any]) -> Any:
         if not args:
@@ -94,25 +114,48 @@ def make_filesystem() -> Dict[str, Any]:
     }
 
 
-def make_json() -> Dict[str, Any]:
+# orjson parses and serializes severalfold faster than json when it's
+# installed; optional dependency, so fall back silently
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data: Any) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> str:
+    # orjson only knows 2-space indentation; other widths keep json
+    if _orjson is not None and indent in (None, 2):
+        option = _orjson.OPT_INDENT_2 if indent == 2 else 0
+        return _orjson.dumps(data, option=option).decode()
+    return json.dumps(data, indent=indent)
+
+
+def _build_json() -> Dict[str, Any]:
     """JSON serialization and parsing."""
     
     def parse(args: List[Any]) -> Any:
         if not args:
             raise ValueError("json.parse requires a string")
-        return json.loads(args[0])
+        return _json_loads(args[0])
     
     def stringify(args: List[Any]) -> Any:
         if not args:
             raise ValueError("json.stringify requires a value")
         indent = args[1] if len(args) > 1 else None
-        return json.dumps(args[0], indent=indent)
+        return _json_dumps(args[0], indent)
     
     def read_file(args: List[Any]) -> Any:
         if not args:
             raise ValueError("json.read_file requires a path")
         path = Path(args[0])
-        return json.loads(path.read_text())
+        # bytes keeps orjson on its decode-free fast path
+        return _json_loads(path.read_bytes())
     
     def write_file(args: List[Any]) -> Any:
         if len(args) < 2:
@@ -120,7 +163,7 @@ def make_json() -> Dict[str, Any]:
         path = Path(args[0])
         data = args[1]
         indent = args[2] if len(args) > 2 else 2
-        path.write_text(json.dumps(data, indent=indent))
+        path.write_text(_json_dumps(data, indent))
         return True
     
     return {
@@ -131,31 +174,50 @@ def make_json() -> Dict[str, Any]:
     }
 
 
-def make_yaml() -> Dict[str, Any]:
+# PyYAML costs tens of milliseconds to import (more with libyaml), so
+# it loads on the first yaml.* call instead of at module import
+_yaml_mod = None
+_YAML_LOADER = None
+_YAML_DUMPER = None
+
+
+def _yaml():
+    global _yaml_mod, _YAML_LOADER, _YAML_DUMPER
+    if _yaml_mod is None:
+        import yaml
+        _yaml_mod = yaml
+        # libyaml-backed C loader/dumper when PyYAML was built with it;
+        # same safe-load semantics, less per-event Python overhead
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return _yaml_mod
+
+
+def _build_yaml() -> Dict[str, Any]:
     """YAML serialization and parsing."""
     
     def parse(args: List[Any]) -> Any:
         if not args:
             raise ValueError("yaml.parse requires a string")
-        return yaml.safe_load(args[0])
+        return _yaml().load(args[0], Loader=_YAML_LOADER)
     
     def dump(args: List[Any]) -> Any:
         if not args:
             raise ValueError("yaml.dump requires a value")
-        return yaml.dump(args[0])
+        return _yaml().dump(args[0], Dumper=_YAML_DUMPER)
     
     def read_file(args: List[Any]) -> Any:
         if not args:
             raise ValueError("yaml.read_file requires a path")
         path = Path(args[0])
-        return yaml.safe_load(path.read_text())
+        return _yaml().load(path.read_text(), Loader=_YAML_LOADER)
     
     def write_file(args: List[Any]) -> Any:
         if len(args) < 2:
             raise ValueError("yaml.write_file requires path and data")
         path = Path(args[0])
         data = args[1]
-        path.write_text(yaml.dump(data))
+        path.write_text(_yaml().dump(data, Dumper=_YAML_DUMPER))
         return True
     
     return {
@@ -166,7 +228,33 @@ def make_yaml() -> Dict[str, Any]:
     }
 
 
-def make_random() -> Dict[str, Any]:
+# Optional vectorized RNG for large workloads; same optional-dependency
+# handling as numba in jit_compile
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+# Default charset for random.string, built once instead of
+# concatenated per call; the tuple twin is what random.choices
+# indexes fastest
+_DEFAULT_CHARSET = string.ascii_letters + string.digits
+_DEFAULT_CHARSET_TUPLE = tuple(_DEFAULT_CHARSET)
+
+
+# Lemire's multiply-shift draws a bounded index from one 64-bit word
+# with a multiply and a shift -- no division, no rejection loop like
+# random.shuffle's _randbelow. The residual bias at 64 bits is
+# negligible for any list that fits in memory.
+def _fisher_yates(lst: List[Any]) -> None:
+    getrandbits = random.getrandbits
+    for i in range(len(lst) - 1, 0, -1):
+        j = (getrandbits(64) * (i + 1)) >> 64
+        lst[i], lst[j] = lst[j], lst[i]
+
+
+def _build_random() -> Dict[str, Any]:
     """Random number and string generation."""
     
     def random_int(args: List[Any]) -> Any:
@@ -186,17 +274,48 @@ def make_random() -> Dict[str, Any]:
     
     def random_string(args: List[Any]) -> Any:
         length = args[0] if args else 10
-        chars = args[1] if len(args) > 1 else string.ascii_letters + string.digits
-        return ''.join(random.choice(chars) for _ in range(length))
+        chars = args[1] if len(args) > 1 else _DEFAULT_CHARSET
+        # Very long ASCII strings: draw all indices in one vectorized
+        # call and gather bytes from the charset
+        if _np is not None and length > 2048:
+            data = chars.encode()
+            if len(data) == len(chars):
+                idx = _np.random.default_rng().integers(0, len(data), size=length)
+                return bytes(_np.frombuffer(data, dtype=_np.uint8)[idx]).decode()
+        # choices bulk-generates in C; one call instead of one
+        # random.choice per character
+        if chars is _DEFAULT_CHARSET:
+            chars = _DEFAULT_CHARSET_TUPLE
+        return ''.join(random.choices(chars, k=length))
     
     def uuid4(args: List[Any]) -> Any:
+        import uuid
         return str(uuid.uuid4())
     
     def shuffle(args: List[Any]) -> Any:
         if not args:
             raise ValueError("shuffle requires a list")
-        lst = args[0].copy()
-        random.shuffle(lst)
+        lst = list(args[0])
+        # Large homogeneous numeric lists shuffle fastest as a NumPy
+        # array; anything mixed (or huge ints) falls through. The
+        # homogeneity scan matters: asarray silently coerces mixed
+        # input (int+str to a str dtype, int+float to float64), which
+        # would hand back altered elements
+        if (_np is not None and len(lst) > 1000
+                and type(lst[0]) in (int, float)
+                and all(type(x) is type(lst[0]) for x in lst)):
+            try:
+                arr = _np.asarray(lst)
+                # object dtype still slips through for huge ints
+                if arr.dtype.kind in "iuf":
+                    _np.random.default_rng().shuffle(arr)
+                    return arr.tolist()
+            except (OverflowError, ValueError):
+                pass
+        if len(lst) < 256:
+            random.shuffle(lst)
+        else:
+            _fisher_yates(lst)
         return lst
     
     return {
@@ -209,7 +328,64 @@ def make_random() -> Dict[str, Any]:
     }
 
 
-def make_date() -> Dict[str, Any]:
+# datetime.strptime re-tokenizes its format string on every call. For
+# the numeric directives below a precompiled regex can feed the datetime
+# constructor directly; formats using anything else fall back to strptime.
+_STRPTIME_FIELDS = {
+    "%Y": r"(?P<year>\d{4})",
+    "%m": r"(?P<month>\d{1,2})",
+    "%d": r"(?P<day>\d{1,2})",
+    "%H": r"(?P<hour>\d{1,2})",
+    "%M": r"(?P<minute>\d{1,2})",
+    "%S": r"(?P<second>\d{1,2})",
+}
+
+
+def _fmt_to_regex(fmt: str) -> Optional[re.Pattern]:
+    pattern = ""
+    i = 0
+    while i < len(fmt):
+        if fmt[i] == "%":
+            field = _STRPTIME_FIELDS.get(fmt[i:i + 2])
+            if field is None:
+                return None
+            pattern += field
+            i += 2
+        else:
+            pattern += re.escape(fmt[i])
+            i += 1
+    try:
+        return re.compile(pattern + r"\Z")
+    except re.error:
+        # e.g. a repeated directive duplicating a group name
+        return None
+
+
+_COMMON_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M",
+    "%Y%m%d",
+)
+_FMT_RE = {fmt: _fmt_to_regex(fmt) for fmt in _COMMON_FORMATS}
+
+
+# Scripts tend to parse and format the same timestamps over and over,
+# so both the datetime objects and rendered strings are worth caching
+# (datetime is immutable, sharing is safe)
+@lru_cache(maxsize=4096)
+def _parse_iso(s: str) -> datetime:
+    return datetime.fromisoformat(s)
+
+
+@lru_cache(maxsize=4096)
+def _format_iso(s: str, fmt: str) -> str:
+    return _parse_iso(s).strftime(fmt)
+
+
+def _build_date() -> Dict[str, Any]:
     """Date and time operations."""
     
     def now(args: List[Any]) -> Any:
@@ -218,43 +394,107 @@ def make_date() -> Dict[str, Any]:
     def parse(args: List[Any]) -> Any:
         if not args:
             raise ValueError("date.parse requires a string")
-        return datetime.fromisoformat(args[0]).isoformat()
+        return _parse_iso(args[0]).isoformat()
     
     def format(args: List[Any]) -> Any:
         if len(args) < 2:
             raise ValueError("date.format requires date and format string")
-        dt = datetime.fromisoformat(args[0])
-        return dt.strftime(args[1])
+        return _format_iso(args[0], args[1])
     
     def add_days(args: List[Any]) -> Any:
         if len(args) < 2:
             raise ValueError("add_days requires date and days")
-        dt = datetime.fromisoformat(args[0])
+        dt = _parse_iso(args[0])
         days = args[1]
         return (dt + timedelta(days=days)).isoformat()
     
     def diff(args: List[Any]) -> Any:
         if len(args) < 2:
             raise ValueError("diff requires two dates")
-        dt1 = datetime.fromisoformat(args[0])
-        dt2 = datetime.fromisoformat(args[1])
+        dt1 = _parse_iso(args[0])
+        # Equal strings are the same instant; the second parse can be
+        # skipped, but only after the first has validated the input
+        if args[0] == args[1]:
+            return 0.0
+        dt2 = _parse_iso(args[1])
         return (dt2 - dt1).total_seconds()
     
+    def strptime(args: List[Any]) -> Any:
+        if len(args) < 2:
+            raise ValueError("date.strptime requires a string and format")
+        fmt = args[1]
+        if fmt not in _FMT_RE:
+            _FMT_RE[fmt] = _fmt_to_regex(fmt)
+        pattern = _FMT_RE[fmt]
+        if pattern is not None:
+            match = pattern.match(args[0])
+            if match:
+                fields = {name: int(value)
+                          for name, value in match.groupdict().items()}
+                return datetime(**fields).isoformat()
+        return datetime.strptime(args[0], fmt).isoformat()
+    
     return {
         "now": NativeFunction("now", now),
         "parse": NativeFunction("parse", parse),
         "format": NativeFunction("format", format),
         "add_days": NativeFunction("add_days", add_days),
         "diff": NativeFunction("diff", diff),
+        "strptime": NativeFunction("strptime", strptime),
     }
 
 
-def make_process() -> Dict[str, Any]:
+# Persistent bash coprocess for shell-heavy scripts: successive exec
+# calls reuse one shell instead of paying fork+exec each time. Opt-in
+# via AEGIS_SHELL_COPROC=1 because semantics change -- cwd, environment
+# and shell state persist between calls, and commands that emit more
+# stderr than a pipe buffers before exiting can stall the sentinel.
+_SHELL_SENTINEL = "__AEG_END__"
+_shell_proc = None
+
+
+def _shell_exec(command: str) -> Dict[str, Any]:
+    global _shell_proc
+    import subprocess
+    if _shell_proc is None or _shell_proc.poll() is not None:
+        _shell_proc = subprocess.Popen(
+            ["bash"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, text=True, bufsize=1)
+        import atexit
+        atexit.register(_shell_proc.terminate)
+    _shell_proc.stdin.write(
+        command
+        + "\nprintf '%s:%s\\n' " + _SHELL_SENTINEL + " $?"
+        + "\nprintf '%s\\n' " + _SHELL_SENTINEL + " 1>&2\n")
+    _shell_proc.stdin.flush()
+    out_lines = []
+    returncode = 0
+    for line in _shell_proc.stdout:
+        if line.startswith(_SHELL_SENTINEL + ":"):
+            returncode = int(line.rstrip().rpartition(":")[2])
+            break
+        out_lines.append(line)
+    err_lines = []
+    for line in _shell_proc.stderr:
+        if line.startswith(_SHELL_SENTINEL):
+            break
+        err_lines.append(line)
+    return {
+        "stdout": "".join(out_lines),
+        "stderr": "".join(err_lines),
+        "returncode": returncode
+    }
+
+
+def _build_process() -> Dict[str, Any]:
     """Process and system operations."""
     
     def exec(args: List[Any]) -> Any:
         if not args:
             raise ValueError("exec requires a command")
+        if os.environ.get("AEGIS_SHELL_COPROC") == "1":
+            import shlex
+            return _shell_exec(shlex.join(str(a) for a in args))
         import subprocess
         result = subprocess.run(args, capture_output=True, text=True)
         return {
@@ -290,7 +530,7 @@ def make_process() -> Dict[str, Any]:
     }
 
 
-def make_math() -> Dict[str, Any]:
+def _build_math() -> Dict[str, Any]:
     """Mathematical operations."""
     import math
     
@@ -312,16 +552,34 @@ def make_math() -> Dict[str, Any]:
     def sqrt(args: List[Any]) -> Any:
         if not args:
             raise ValueError("sqrt requires a number")
-        return math.sqrt(args[0])
+        x = args[0]
+        # Exact integer roots stay integers (and isqrt never loses
+        # precision on huge values the way float sqrt does)
+        if isinstance(x, int) and x >= 0:
+            root = math.isqrt(x)
+            if root * root == x:
+                return root
+        return math.sqrt(x)
     
     def pow(args: List[Any]) -> Any:
         if len(args) < 2:
             raise ValueError("pow requires base and exponent")
-        return math.pow(args[0], args[1])
+        base, exp = args[0], args[1]
+        # ** keeps integer math integral and skips math.pow's
+        # unconditional float conversion; squaring is just a multiply
+        if exp == 2:
+            return base * base
+        # ** would produce a complex here, where math.pow raises; no
+        # complex value may leak into the language
+        if base < 0 and not float(exp).is_integer():
+            raise ValueError("math domain error")
+        return base ** exp
     
     def log(args: List[Any]) -> Any:
         if not args:
             raise ValueError("log requires a number")
+        if len(args) > 1:
+            return math.log(args[0], args[1])
         return math.log(args[0])
     
     def pi(args: List[Any]) -> Any:
@@ -340,3 +598,49 @@ def make_math() -> Dict[str, Any]:
         "pi": NativeFunction("pi", pi),
         "e": NativeFunction("e", e),
     }
+
+
+# Each module table is a constant; build them once at import and hand
+# out shallow copies so callers can rebind entries independently
+_FILESYSTEM_MODULE = _build_filesystem()
+_JSON_MODULE = _build_json()
+_YAML_MODULE = _build_yaml()
+_RANDOM_MODULE = _build_random()
+_DATE_MODULE = _build_date()
+_PROCESS_MODULE = _build_process()
+_MATH_MODULE = _build_math()
+
+
+def make_filesystem() -> Dict[str, Any]:
+    """Enhanced filesystem operations."""
+    return dict(_FILESYSTEM_MODULE)
+
+
+def make_json() -> Dict[str, Any]:
+    """JSON serialization and parsing."""
+    return dict(_JSON_MODULE)
+
+
+def make_yaml() -> Dict[str, Any]:
+    """YAML serialization and parsing."""
+    return dict(_YAML_MODULE)
+
+
+def make_random() -> Dict[str, Any]:
+    """Random number and string generation."""
+    return dict(_RANDOM_MODULE)
+
+
+def make_date() -> Dict[str, Any]:
+    """Date and time operations."""
+    return dict(_DATE_MODULE)
+
+
+def make_process() -> Dict[str, Any]:
+    """Process and system operations."""
+    return dict(_PROCESS_MODULE)
+
+
+def make_math() -> Dict[str, Any]:
+    """Mathematical operations."""
+    return dict(_MATH_MODULE)
@@ -0,0 +1,179 @@
+"""
+Stack VM for Aegis bytecode
+Executes Bytecode produced by compiler.py with a flat dispatch loop
+over an opcode-indexed handler table.
+"""
+
+from __future__ import annotations
+from typing import Any, List
+
+from . import compiler as C
+from .runtime import Environment, FunctionValue, ReturnSignal, RuntimeErrorAegis, is_truthy
+from .interpreter import _call, _get_member, _to_index, _expect_number, assign_to_member
+
+
+class _Frame:
+    __slots__ = ("ops", "consts", "names", "env", "stack", "pc", "result", "running")
+
+    def __init__(self, code: C.Bytecode, env: Environment):
+        self.ops = code.ops
+        self.consts = code.consts
+        self.names = code.names
+        self.env = env
+        self.stack: List[Any] = []
+        self.pc = 0
+        self.result: Any = None
+        self.running = True
+
+
+def execute(code: C.Bytecode, env: Environment) -> Any:
+    """Run bytecode in env and return the last statement's value."""
+    frame = _Frame(code, env)
+    ops = frame.ops
+    table = _OPS
+    while frame.running:
+        pc = frame.pc
+        frame.pc = pc + 2
+        table[ops[pc]](frame, ops[pc + 1])
+    return frame.result
+
+
+def _op_load_const(frame: _Frame, arg: int) -> None:
+    frame.stack.append(frame.consts[arg])
+
+
+def _op_load_name(frame: _Frame, arg: int) -> None:
+    frame.stack.append(frame.env.get(frame.names[arg]))
+
+
+def _op_store_name(frame: _Frame, arg: int) -> None:
+    frame.env.define(frame.names[arg], frame.stack[-1])
+
+
+def _op_assign_name(frame: _Frame, arg: int) -> None:
+    frame.env.assign(frame.names[arg], frame.stack[-1])
+
+
+def _op_store_result(frame: _Frame, arg: int) -> None:
+    frame.result = frame.stack.pop()
+
+
+def _op_jump(frame: _Frame, arg: int) -> None:
+    frame.pc = arg
+
+
+def _op_jump_if_false(frame: _Frame, arg: int) -> None:
+    if not is_truthy(frame.stack.pop()):
+        frame.pc = arg
+
+
+def _op_binop(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    right = stack.pop()
+    stack[-1] = frame.consts[arg](stack[-1], right)
+
+
+def _op_prefix_not(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    stack[-1] = not is_truthy(stack[-1])
+
+
+def _op_prefix_neg(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    stack[-1] = -_expect_number(stack[-1])
+
+
+def _op_call(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    if arg:
+        args = stack[-arg:]
+        del stack[-arg:]
+    else:
+        args = []
+    stack[-1] = _call(stack[-1], args, frame.env)
+
+
+def _op_member(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    stack[-1] = _get_member(stack[-1], frame.names[arg])
+
+
+def _op_index(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    idx = _to_index(stack.pop())
+    stack[-1] = stack[-1][idx]
+
+
+def _op_build_list(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    if arg:
+        elements = stack[-arg:]
+        del stack[-arg:]
+    else:
+        elements = []
+    stack.append(elements)
+
+
+def _op_build_map(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    keys = frame.consts[arg]
+    n = len(keys)
+    if n:
+        values = stack[-n:]
+        del stack[-n:]
+    else:
+        values = []
+    stack.append(dict(zip(keys, values)))
+
+
+def _op_set_member(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    obj = stack.pop()
+    assign_to_member(obj, frame.names[arg], stack[-1])
+
+
+def _op_set_index(frame: _Frame, arg: int) -> None:
+    stack = frame.stack
+    idx = _to_index(stack.pop())
+    coll = stack.pop()
+    coll[idx] = stack[-1]
+
+
+def _op_make_function(frame: _Frame, arg: int) -> None:
+    node = frame.consts[arg]
+    frame.stack.append(
+        FunctionValue(name=node.name, params=node.params, body=node.body, env=frame.env)
+    )
+
+
+def _op_return(frame: _Frame, arg: int) -> None:
+    raise ReturnSignal(frame.stack.pop())
+
+
+def _op_halt(frame: _Frame, arg: int) -> None:
+    frame.running = False
+
+
+# Indexed by opcode; order must match the constants in compiler.py
+_OPS = [
+    _op_load_const,     # LOAD_CONST
+    _op_load_name,      # LOAD_NAME
+    _op_store_name,     # STORE_NAME
+    _op_assign_name,    # ASSIGN_NAME
+    _op_store_result,   # STORE_RESULT
+    _op_jump,           # JUMP
+    _op_jump_if_false,  # JUMP_IF_FALSE
+    _op_binop,          # BINOP
+    _op_prefix_not,     # PREFIX_NOT
+    _op_prefix_neg,     # PREFIX_NEG
+    _op_call,           # CALL
+    _op_member,         # MEMBER
+    _op_index,          # INDEX
+    _op_build_list,     # BUILD_LIST
+    _op_build_map,      # BUILD_MAP
+    _op_set_member,     # SET_MEMBER
+    _op_set_index,      # SET_INDEX
+    _op_make_function,  # MAKE_FUNCTION
+    _op_return,         # RETURN
+    _op_halt,           # HALT
+]
@@ -9,11 +9,12 @@ import os
 import sys
 import hashlib
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict
-import urllib.request
-import urllib.parse
+import requests
 
 
 @dataclass
@@ -42,6 +43,14 @@ class AegisPackageManager:
         self.vendor_path = self.project_root / "vendor"
         self.cache_path = Path.home() / ".aegpm" / "cache"
         self.cache_path.mkdir(parents=True, exist_ok=True)
+        # (mtime_ns, size)-keyed parse caches; the manifest and lockfile
+        # don't change under us during a single command invocation
+        self._manifest_cache: Optional[tuple] = None
+        self._lockfile_cache: Optional[tuple] = None
+        # (name, version) -> PackageInfo, so repeated constraints on the
+        # same package hit the network once per invocation
+        self._pkg_info_cache: Dict[tuple, PackageInfo] = {}
+        self._session: Optional[requests.Session] = None
         
     def init(self, name: str, version: str = "1.0.0") -> None:
         """Initialize a new Aegis project with package manifest."""
@@ -101,10 +110,12 @@ class AegisPackageManager:
         # Resolve dependency tree
         resolved = self._resolve_dependencies(manifest)
         
-        # Install packages
+        # Install packages; clones are network-bound, so run them on
+        # the same sized pool as the resolver
         self.vendor_path.mkdir(exist_ok=True)
-        for pkg_name, pkg_info in resolved.items():
-            self._install_package(pkg_name, pkg_info)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(lambda item: self._install_package(*item),
+                              resolved.items()))
             
         # Update lockfile
         self._save_lockfile(resolved)
@@ -136,74 +147,145 @@ class AegisPackageManager:
         print(f"Published {manifest['name']}@{manifest['version']}")
         
     def _load_manifest(self) -> Dict:
-        if not self.manifest_path.exists():
+        try:
+            st = self.manifest_path.stat()
+        except FileNotFoundError:
             return {}
+        key = (st.st_mtime_ns, st.st_size)
+        if self._manifest_cache is not None and self._manifest_cache[0] == key:
+            return self._manifest_cache[1]
         with open(self.manifest_path) as f:
-            return json.load(f)
+            manifest = json.load(f)
+        self._manifest_cache = (key, manifest)
+        return manifest
             
     def _save_manifest(self, manifest: Dict) -> None:
         with open(self.manifest_path, 'w') as f:
             json.dump(manifest, f, indent=2)
+        st = self.manifest_path.stat()
+        self._manifest_cache = ((st.st_mtime_ns, st.st_size), manifest)
             
     def _load_lockfile(self) -> Dict[str, LockEntry]:
-        if not self.lock_path.exists():
+        try:
+            st = self.lock_path.stat()
+        except FileNotFoundError:
             return {}
+        key = (st.st_mtime_ns, st.st_size)
+        if self._lockfile_cache is not None and self._lockfile_cache[0] == key:
+            return self._lockfile_cache[1]
         with open(self.lock_path) as f:
             data = json.load(f)
-        return {name: LockEntry(**entry) for name, entry in data.items()}
+        entries = {name: LockEntry(**entry) for name, entry in data.items()}
+        self._lockfile_cache = (key, entries)
+        return entries
         
     def _save_lockfile(self, resolved: Dict[str, PackageInfo]) -> None:
-        lock_data = {}
-        for name, pkg in resolved.items():
-            lock_data[name] = asdict(LockEntry(
-                name=pkg.name,
-                version=pkg.version,
-                source=pkg.source,
-                checksum=pkg.checksum or "",
-                dependencies=pkg.dependencies or {}
-            ))
+        # Same shape as asdict(LockEntry(...)) without the per-entry
+        # dataclass construction and asdict's recursive deep copy
+        lock_data = {
+            name: {
+                "name": pkg.name,
+                "version": pkg.version,
+                "source": pkg.source,
+                "checksum": pkg.checksum or "",
+                "dependencies": pkg.dependencies or {},
+            }
+            for name, pkg in resolved.items()
+        }
         with open(self.lock_path, 'w') as f:
             json.dump(lock_data, f, indent=2)
+        self._lockfile_cache = None
             
     def _resolve_dependencies(self, manifest: Dict) -> Dict[str, PackageInfo]:
         """Resolve dependency tree with version constraints."""
         resolved = {}
-        to_resolve = []
+        to_resolve = deque()
+        seen = set()
         
         # Add direct dependencies
         for deps_key in ["dependencies", "devDependencies"]:
             for name, version in manifest.get(deps_key, {}).items():
-                to_resolve.append((name, version))
+                if name not in seen:
+                    seen.add(name)
+                    to_resolve.append((name, version))
                 
-        while to_resolve:
-            name, version = to_resolve.pop(0)
-            if name in resolved:
-                continue
-                
-            pkg_info = self._fetch_package_info(name, version)
-            resolved[name] = pkg_info
-            
-            # Add sub-dependencies
-            for dep_name, dep_version in pkg_info.dependencies.items():
-                to_resolve.append((dep_name, dep_version))
+        # Fetches are blocking network calls, so walk the tree level by
+        # level with every fetch in a level in flight at once
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            while to_resolve:
+                frontier = list(to_resolve)
+                to_resolve.clear()
+                infos = executor.map(self._fetch_package_info,
+                                     (n for n, _ in frontier),
+                                     (v for _, v in frontier))
+                for (name, version), pkg_info in zip(frontier, infos):
+                    resolved[name] = pkg_info
+                    
+                    # Add sub-dependencies; skip ones already seen so
+                    # duplicates never enter the queue
+                    for dep_name, dep_version in pkg_info.dependencies.items():
+                        if dep_name not in seen:
+                            seen.add(dep_name)
+                            to_resolve.append((dep_name, dep_version))
                 
         return resolved
         
     def _fetch_package_info(self, name: str, version: str) -> PackageInfo:
         """Fetch package information from registry or git."""
+        key = (name, version)
+        cached = self._pkg_info_cache.get(key)
+        if cached is not None:
+            return cached
+        # Pinned versions are immutable, so their metadata persists on
+        # disk across invocations; "latest" always goes to the network
+        pinned = version != "latest"
+        disk_path = self.cache_path / f"{name}-{version}.json"
+        if pinned:
+            try:
+                pkg_info = PackageInfo(**json.loads(disk_path.read_text()))
+                self._pkg_info_cache[key] = pkg_info
+                return pkg_info
+            except (OSError, ValueError, TypeError):
+                pass
         # Try registry first
         try:
-            return self._fetch_from_registry(name, version)
+            pkg_info = self._fetch_from_registry(name, version)
+            if pinned:
+                self._write_metadata_cache(disk_path, pkg_info)
         except:
             # Fallback to git
-            return self._fetch_from_git(name, version)
+            pkg_info = self._fetch_from_git(name, version)
+        self._pkg_info_cache[key] = pkg_info
+        return pkg_info
             
+    def _write_metadata_cache(self, disk_path: Path, pkg_info: PackageInfo) -> None:
+        """Atomically persist registry metadata (write-then-rename)."""
+        try:
+            tmp = disk_path.with_name(disk_path.name + ".tmp")
+            tmp.write_text(json.dumps(asdict(pkg_info)))
+            os.replace(tmp, disk_path)
+        except OSError:
+            # Cache write failure is never fatal; next run refetches
+            pass
+            
+    def _http_session(self) -> requests.Session:
+        """Keep-alive session shared by all registry fetches."""
+        # TLS setup dominates small JSON GETs; one session pays it once.
+        # Pool sized to match the resolver's thread pool.
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+        
     def _fetch_from_registry(self, name: str, version: str) -> PackageInfo:
         """Fetch package from registry."""
         registry_url = f"https://registry.aegis.dev/{name}/{version}"
-        with urllib.request.urlopen(registry_url) as response:
-            data = json.loads(response.read())
-        return PackageInfo(**data)
+        response = self._http_session().get(registry_url, timeout=30)
+        response.raise_for_status()
+        return PackageInfo(**response.json())
         
     def _fetch_from_git(self, name: str, version: str) -> PackageInfo:
         """Fetch package from git repository."""
@@ -219,6 +301,16 @@ class AegisPackageManager:
     def _install_package(self, name: str, pkg_info: PackageInfo) -> None:
         """Install a single package to vendor directory."""
         pkg_dir = self.vendor_path / name
+        marker = pkg_dir / ".aegpm-checksum"
+        
+        # An existing install at exactly this checksum needs no git
+        # subprocess at all -- the common case after aeg.lock
+        if pkg_info.checksum and pkg_dir.exists():
+            try:
+                if marker.read_text() == pkg_info.checksum:
+                    return
+            except OSError:
+                pass
         
         if pkg_info.source.startswith('http'):
             # Git clone
@@ -226,16 +318,37 @@ class AegisPackageManager:
                 subprocess.run(['git', 'pull'], cwd=pkg_dir, check=True)
             else:
                 subprocess.run(['git', 'clone', pkg_info.source, str(pkg_dir)], check=True)
+            if pkg_info.checksum:
+                try:
+                    marker.write_text(pkg_info.checksum)
+                except OSError:
+                    pass
         else:
             # Local path
             pkg_dir.symlink_to(Path(pkg_info.source).resolve())
             
+    # Directories that never belong in a published tarball
+    _TARBALL_EXCLUDE = {"vendor", ".git", ".aegpm", "node_modules", "__pycache__"}
+
     def _create_tarball(self) -> Path:
         """Create tarball of current project."""
         import tarfile
         tarball_path = self.cache_path / f"{self._load_manifest()['name']}.tar.gz"
-        with tarfile.open(tarball_path, 'w:gz') as tar:
-            tar.add(self.project_root, arcname='.')
+        
+        def _exclude(tarinfo):
+            if any(part in self._TARBALL_EXCLUDE
+                   for part in Path(tarinfo.name).parts):
+                return None
+            return tarinfo
+        
+        # Streaming mode writes the archive sequentially with no
+        # end-of-archive seeks, so it never sits fully in memory; the
+        # gzip wrapper is what lets us pick a compression level ('w|gz'
+        # hardwires level 9)
+        import gzip
+        with gzip.open(tarball_path, 'wb', compresslevel=6) as gz:
+            with tarfile.open(fileobj=gz, mode='w|') as tar:
+                tar.add(self.project_root, arcname='.', filter=_exclude)
         return tarball_path
         
     def _upload_package(self, tarball_path: Path, registry: str) -> None:
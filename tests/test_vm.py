@@ -0,0 +1,50 @@
+import pytest
+
+from aegis.parser import parse
+from aegis.compiler import compile_program
+from aegis.vm import execute
+from aegis.interpreter import evaluate
+from aegis.env import make_global_env
+
+
+def run(src: str):
+    env = make_global_env()
+    code = compile_program(parse(src))
+    return execute(code, env)
+
+
+def test_arithmetic_string_array():
+    assert run("1 + 2;") == 3
+    assert run('"a" + 1;') == "a1"
+    assert run('[1,2] + [3];') == [1,2,3]
+
+
+def test_let_set_and_if_while():
+    src = """
+    let x = 1;
+    set x = x + 2;
+    let i = 0;
+    while (i < 3) { set i = i + 1; }
+    x + i;
+    """
+    assert run(src) == 6
+
+
+def test_function_call_and_return():
+    src = """
+    fn add(a, b) { return a + b; }
+    add(40, 2);
+    """
+    assert run(src) == 42
+
+
+def test_matches_tree_walker():
+    src = """
+    let a = [1, 9, 3];
+    let o = { "k": a };
+    let total = 0;
+    let i = 0;
+    while (i < o.k.length) { set total = total + o.k[i]; set i = i + 1; }
+    total;
+    """
+    assert run(src) == evaluate(parse(src), make_global_env())